@@ -44,6 +44,19 @@ def _evaluate(gs: GameState, player_idx: int) -> float:
     return score
 
 
+def _sim_copy(gs: GameState) -> GameState:
+    """Deep-copy *gs* for lookahead, sharing the read-only ``card_db``.
+
+    Cards are frozen and never modified during play, so pre-seeding the
+    deepcopy memo with the DB skips copying every card on each candidate.
+    The RNG is seeded into the memo as a shallow copy: Random's state is an
+    immutable tuple that setstate() loads in C, whereas deepcopy would walk
+    all 625 ints of it.
+    """
+    memo = {id(gs.card_db): gs.card_db, id(gs.rng): copy.copy(gs.rng)}
+    return copy.deepcopy(gs, memo)
+
+
 def _simulate_combat_lookahead(sim: GameState, action: Action) -> None:
     """After applying an action on a sim copy, look ahead through combat."""
     from card_battle.engine import _resolve_combat
@@ -83,7 +96,7 @@ class GreedyAI(Agent):
         for action in legal_actions:
             if isinstance(action, EndTurn):
                 continue
-            sim = copy.deepcopy(gs)
+            sim = _sim_copy(gs)
             apply_action(sim, action)
             _simulate_combat_lookahead(sim, action)
             score = _evaluate(sim, player_idx)
@@ -127,7 +140,7 @@ class SimpleAI(Agent):
         for action in legal_actions:
             if isinstance(action, EndTurn):
                 continue
-            sim = copy.deepcopy(gs)
+            sim = _sim_copy(gs)
             apply_action(sim, action)
             score = _evaluate(sim, player_idx)
             if score > best_score:
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import hashlib
 import json
 import random
+import zlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from card_battle.evaluation import evaluate_deck_vs_pool, evaluate_targets, telemetry_aggregate
 from card_battle.loader import load_cards, load_deck
@@ -32,6 +35,15 @@ def _candidate_id(template: str, params: dict[str, Any], seed: int) -> str:
 # Forbid checking
 # -------------------------------------------------------------------------
 
+_FORBID_GLOBALS: dict[str, Any] = {"__builtins__": {}}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> Any:
+    """Compile a forbid condition once per distinct string."""
+    return compile(condition, "<forbid>", "eval")
+
+
 def _check_forbid(
     template: str, cost: int, params: dict[str, Any],
     forbid_rules: list[dict[str, Any]],
@@ -47,7 +59,8 @@ def _check_forbid(
         ns = dict(params)
         ns["cost"] = cost
         try:
-            if eval(condition, {"__builtins__": {}}, ns):  # noqa: S307
+            code = _compile_condition(condition)
+            if eval(code, _FORBID_GLOBALS, ns):  # noqa: S307
                 return True
         except Exception:
             continue
@@ -58,6 +71,54 @@ def _check_forbid(
 # Candidate generation
 # -------------------------------------------------------------------------
 
+def _counter_target_decks(definition: dict[str, Any]) -> list[str]:
+    tid = definition.get("target_deck_id")
+    return [tid] if tid else []
+
+
+def _no_target_decks(definition: dict[str, Any]) -> list[str]:
+    return []
+
+
+# Pattern type -> target deck extractor. Iteration order is the order in
+# which top patterns are selected.
+_PATTERN_TYPE_HANDLERS: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+    "counter": _counter_target_decks,
+    "sequence": _no_target_decks,
+    "cooccurrence": _no_target_decks,
+}
+
+
+# Results keyed by a BLAKE2b digest of the canonical (patterns, constraints,
+# config) JSON. Generation is a pure function of its inputs within a process.
+_generate_candidates_cache: dict[bytes, list[dict[str, Any]]] = {}
+
+# Entries kept per memo; the oldest entry is evicted first
+_CACHE_MAX_ENTRIES = 64
+
+
+def _inputs_digest(*inputs: Any) -> bytes | None:
+    """BLAKE2b digest over the canonical JSON of each input.
+
+    Returns None when an input is not JSON-serializable (callers skip caching).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        for obj in inputs:
+            h.update(json.dumps(obj, sort_keys=True).encode("utf-8"))
+            h.update(b"\0")
+    except (TypeError, ValueError):
+        return None
+    return h.digest()
+
+
+def _cache_put(cache: dict[bytes, Any], key: bytes, value: Any) -> None:
+    """Insert into a memo dict, evicting the oldest entries past the cap."""
+    while len(cache) >= _CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
 def generate_candidates(
     patterns: list[dict[str, Any]],
     constraints: dict[str, Any],
@@ -65,8 +126,27 @@ def generate_candidates(
 ) -> list[dict[str, Any]]:
     """Generate candidate cards from patterns + constraints.
 
+    Results are memoized per input; callers always get a fresh deep copy.
     Returns a list of CandidateCard dicts.
     """
+    key = _inputs_digest(patterns, constraints, config)
+    if key is None:
+        return _generate_candidates_uncached(patterns, constraints, config)
+    cached = _generate_candidates_cache.get(key)
+    if cached is None:
+        cached = _generate_candidates_uncached(patterns, constraints, config)
+        _cache_put(_generate_candidates_cache, key, cached)
+    return copy.deepcopy(cached)
+
+
+generate_candidates.cache_clear = _generate_candidates_cache.clear  # type: ignore[attr-defined]
+
+
+def _generate_candidates_uncached(
+    patterns: list[dict[str, Any]],
+    constraints: dict[str, Any],
+    config: dict[str, Any],
+) -> list[dict[str, Any]]:
     seed = config.get("seed", 42)
     rng = random.Random(seed)
 
@@ -86,7 +166,7 @@ def generate_candidates(
         by_type.setdefault(t, []).append(p)
 
     selected_patterns: list[dict[str, Any]] = []
-    for ptype in ["counter", "sequence", "cooccurrence"]:
+    for ptype in _PATTERN_TYPE_HANDLERS:
         pool = by_type.get(ptype, [])
         # Already sorted by -lift, -support from patterns.json
         n = top_per_type.get(ptype, 10)
@@ -98,10 +178,11 @@ def generate_candidates(
 
     # Generate candidates
     candidates: list[dict[str, Any]] = []
-    seen_keys: set[str] = set()  # (template, params_canonical) for dedup
+    seen_keys: set[tuple[Any, ...]] = set()  # (template, sorted params, cost) for dedup
 
     for pat in selected_patterns:
         pat_type = pat.get("type", "")
+        target_decks_of = _PATTERN_TYPE_HANDLERS[pat_type]
         pat_id = pat.get("pattern_id", "")
         pat_def = pat.get("definition", {})
         pat_stats = pat.get("stats", {})
@@ -142,22 +223,17 @@ def generate_candidates(
                 continue
 
             # Dedup
-            dedup_key = json.dumps(
-                {"template": tmpl_name, "params": params, "cost": cost},
-                sort_keys=True,
-            )
+            dedup_key = (tmpl_name, tuple(sorted(params.items())), cost)
             if dedup_key in seen_keys:
                 continue
             seen_keys.add(dedup_key)
 
-            cid = _candidate_id(tmpl_name, params, seed + ci + hash(pat_id))
+            # crc32, not hash(): str hashes vary with PYTHONHASHSEED per process
+            pat_salt = zlib.crc32(pat_id.encode("utf-8"))
+            cid = _candidate_id(tmpl_name, params, seed + ci + pat_salt)
 
             # Target info
-            target_deck_ids = []
-            if pat_type == "counter":
-                tid = pat_def.get("target_deck_id")
-                if tid:
-                    target_deck_ids = [tid]
+            target_deck_ids = target_decks_of(pat_def)
 
             candidate = {
                 "id": cid,
@@ -231,34 +307,36 @@ def build_deck_variants(
         cost_dist = abs(c.cost - cand_card.cost)
         return (tmpl_match, cost_dist, cid)
 
-    replaceable = sorted(card_ids_in_deck, key=_replacement_priority)
+    replaceable = [
+        rid for rid in sorted(card_ids_in_deck, key=_replacement_priority)
+        if rid != candidate_id
+    ]
+
+    # Forward check: bound the copy count before building any trial deck.
+    # The candidate may not exceed MAX_COPIES, and we can only swap out as
+    # many copies as the other cards hold in total.
+    existing = counts.get(candidate_id, 0)
+    removable = sum(counts[rid] for rid in replaceable)
+    n_max = min(max_copies, MAX_COPIES - existing, removable)
 
     variants: list[DeckDef] = []
-    for n_copies in range(1, max_copies + 1):
+    for n_copies in range(1, n_max + 1):
         trial = dict(counts)
-        removed = 0
+        needed = n_copies
         for rid in replaceable:
-            if removed >= n_copies:
+            if needed == 0:
                 break
-            if rid == candidate_id:
-                continue
-            can_remove = min(trial.get(rid, 0), n_copies - removed)
-            if can_remove > 0:
-                trial[rid] -= can_remove
-                if trial[rid] == 0:
-                    del trial[rid]
-                removed += can_remove
-
-        if removed < n_copies:
-            break  # Can't fit more copies
+            # Domain for this card is [0, min(count, needed)]; take the max
+            take = min(trial[rid], needed)
+            if take == trial[rid]:
+                del trial[rid]
+            else:
+                trial[rid] -= take
+            needed -= take
 
-        trial[candidate_id] = trial.get(candidate_id, 0) + n_copies
+        trial[candidate_id] = existing + n_copies
 
-        # Validate
-        total = sum(trial.values())
-        if total != DECK_SIZE:
-            break
-        if any(c < 1 or c > MAX_COPIES for c in trial.values()):
+        if sum(trial.values()) != DECK_SIZE:
             break
 
         try:
@@ -296,6 +374,46 @@ def _telemetry_aggregate(summaries: list[dict[str, Any]]) -> dict[str, float]:
     return telemetry_aggregate(summaries)
 
 
+# "Before" baselines do not depend on the candidate, so every candidate in a
+# run shares one evaluation. Keyed like _generate_candidates_cache.
+_baseline_cache: dict[bytes, dict[str, Any]] = {}
+
+
+def _baseline_for(
+    targets: list[DeckDef],
+    card_db: dict[str, Card],
+    config: dict[str, Any],
+    seed: int,
+) -> dict[str, Any]:
+    """Evaluate the unmodified targets once per (targets, pool, seed, eval config)."""
+    adoption_cfg = config.get("adoption", {})
+    matches_per_eval = adoption_cfg.get("matches_per_eval", 1)
+    policy_mix = adoption_cfg.get("policy_mix")
+
+    key = _inputs_digest(
+        [[d.deck_id, [[e.card_id, e.count] for e in d.entries]] for d in targets],
+        [
+            [c.id, c.name, c.cost, c.card_type, list(c.tags), c.template, c.params, c.rarity]
+            for _, c in sorted(card_db.items())
+        ],
+        [seed, matches_per_eval, policy_mix],
+    )
+    if key is None:
+        return _evaluate_targets(
+            targets, card_db, seed, matches_per_eval, policy_mix,
+        )
+    cached = _baseline_cache.get(key)
+    if cached is None:
+        cached = _evaluate_targets(
+            targets, card_db, seed, matches_per_eval, policy_mix,
+        )
+        _cache_put(_baseline_cache, key, cached)
+    return copy.deepcopy(cached)
+
+
+_baseline_for.cache_clear = _baseline_cache.clear  # type: ignore[attr-defined]
+
+
 def adoption_test_one(
     candidate: dict[str, Any],
     targets: list[DeckDef],
@@ -325,10 +443,8 @@ def adoption_test_one(
         rarity="uncommon",
     )
 
-    # Before: evaluate with original card_db
-    before = _evaluate_targets(
-        targets, card_db, seed, matches_per_eval, policy_mix,
-    )
+    # Before: evaluate with original card_db (shared across candidates)
+    before = _baseline_for(targets, card_db, config, seed)
 
     # After: add candidate to card_db, build variants, evaluate
     card_db_after = dict(card_db)
@@ -415,28 +531,26 @@ def check_acceptance(
     """Check if a candidate meets acceptance criteria."""
     acc = config.get("adoption", {}).get("acceptance", {})
     delta = report.get("delta", {})
-    after = report.get("after", {})
 
-    min_delta = acc.get("min_overall_delta", 0.02)
-    max_wr = acc.get("max_win_rate", 0.95)
-    max_turns_pct = acc.get("max_turns_delta_pct", 0.20)
+    # Checks run cheapest-first; most candidates fail the overall delta
+    # check, so nothing else is looked up for them.
 
     # Overall delta check
-    if delta.get("overall_win_rate_delta", 0) < min_delta:
+    if delta.get("overall_win_rate_delta", 0) < acc.get("min_overall_delta", 0.02):
         return False
 
     # No extreme win rate
-    for wr in after.get("win_rates_by_target", {}).values():
-        if wr > max_wr:
-            return False
+    max_wr = acc.get("max_win_rate", 0.95)
+    win_rates = report.get("after", {}).get("win_rates_by_target", {})
+    if any(wr > max_wr for wr in win_rates.values()):
+        return False
 
     # Turns delta check
     before_telem = report.get("before", {}).get("telemetry_aggregate", {})
-    telem_delta = delta.get("telemetry_delta", {})
     avg_turns_before = before_telem.get("avg_total_turns", 0)
     if avg_turns_before > 0:
-        turns_change = abs(telem_delta.get("avg_total_turns", 0))
-        if turns_change / avg_turns_before > max_turns_pct:
+        turns_change = abs(delta.get("telemetry_delta", {}).get("avg_total_turns", 0))
+        if turns_change / avg_turns_before > acc.get("max_turns_delta_pct", 0.20):
             return False
 
     return True
@@ -569,5 +683,8 @@ def run_cardgen(
 
 
 def _write_json(path: Path, data: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Encode in one pass and issue a single write; json.dump streams many
+    # small chunks through the file object.
+    buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(buf)
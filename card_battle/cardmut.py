@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import itertools
 import json
 import random
 from typing import Any
@@ -18,21 +20,26 @@ TEMPLATE_FAMILIES: dict[str, list[str]] = {
     "damage": ["DamagePlayer", "OnPlayDamagePlayer"],
 }
 
+# Reverse index: template -> family name
+_TEMPLATE_TO_FAMILY: dict[str, str] = {
+    t: family for family, members in TEMPLATE_FAMILIES.items() for t in members
+}
+
+# Swap targets per template (same family, excluding self)
+_SWAP_TARGETS: dict[str, tuple[str, ...]] = {
+    t: tuple(m for m in members if m != t)
+    for members in TEMPLATE_FAMILIES.values() for t in members
+}
+
 
 def _family_of(template: str) -> str | None:
     """Return family name or None if singleton."""
-    for family, members in TEMPLATE_FAMILIES.items():
-        if template in members:
-            return family
-    return None
+    return _TEMPLATE_TO_FAMILY.get(template)
 
 
 def _swap_targets(template: str) -> list[str]:
     """Return list of templates in same family (excluding self)."""
-    family = _family_of(template)
-    if family is None:
-        return []
-    return [t for t in TEMPLATE_FAMILIES[family] if t != template]
+    return list(_SWAP_TARGETS.get(template, ()))
 
 
 # -------------------------------------------------------------------------
@@ -57,7 +64,11 @@ def _op_param_jitter(
     constraints: dict[str, Any],
     rng: random.Random,
 ) -> dict[str, Any] | None:
-    """Jitter a random numeric param by +/-1, clamped to params_ranges."""
+    """Jitter a random numeric param by +/-1 within params_ranges.
+
+    Samples uniformly from the (key, delta) moves that stay in range, so the
+    result always changes exactly one param. Returns None if no move exists.
+    """
     template = parent["template"]
     spec = constraints.get("templates", {}).get(template)
     if spec is None:
@@ -67,13 +78,17 @@ def _op_param_jitter(
         return None
 
     params = dict(parent["params"])
-    keys = sorted(params_ranges.keys())
-    key = rng.choice(keys)
-    delta = rng.choice([-1, 1])
-    new_val = params.get(key, 0) + delta
+    feasible: list[tuple[str, int]] = []
+    for k, (lo, hi) in sorted(params_ranges.items()):
+        val = params.get(k, 0)
+        for d in (-1, 1):
+            if lo <= val + d <= hi:
+                feasible.append((k, d))
+    if not feasible:
+        return None
 
-    lo, hi = params_ranges[key]
-    new_val = max(lo, min(hi, new_val))
+    key, delta = rng.choice(feasible)
+    new_val = params.get(key, 0) + delta
     params[key] = new_val
 
     return {
@@ -89,19 +104,21 @@ def _op_cost_adjust(
     constraints: dict[str, Any],
     rng: random.Random,
 ) -> dict[str, Any] | None:
-    """Adjust cost by +/-1, with compensating param adjustment."""
+    """Adjust cost by +/-1 within cost_range, with compensating param adjustment.
+
+    Samples from the in-range directions only; returns None if neither fits.
+    """
     template = parent["template"]
     spec = constraints.get("templates", {}).get(template)
     if spec is None:
         return None
 
     cost_lo, cost_hi = spec.get("cost_range", [1, 5])
-    delta = rng.choice([-1, 1])
-    new_cost = parent["cost"] + delta
-    new_cost = max(cost_lo, min(cost_hi, new_cost))
-
-    if new_cost == parent["cost"]:
+    feasible = [d for d in (-1, 1) if cost_lo <= parent["cost"] + d <= cost_hi]
+    if not feasible:
         return None
+    delta = rng.choice(feasible)
+    new_cost = parent["cost"] + delta
 
     params = dict(parent["params"])
     params_ranges = spec.get("params_ranges", {})
@@ -137,7 +154,7 @@ def _op_template_swap_within_family(
 ) -> dict[str, Any] | None:
     """Swap template within the same family, remapping params."""
     template = parent["template"]
-    targets = _swap_targets(template)
+    targets = _SWAP_TARGETS.get(template, ())
     if not targets:
         return None
 
@@ -170,6 +187,17 @@ def _op_template_swap_within_family(
     }
 
 
+def _split_total(
+    total: int, atk: int, atk_lo: int, atk_hi: int, hp_lo: int, hp_hi: int,
+) -> tuple[int, int]:
+    """Split total into (atk, hp) from a drawn atk, clamping both to range."""
+    # Clamp hp
+    hp = max(hp_lo, min(hp_hi, total - atk))
+    # Recompute atk from clamped hp to maintain total if possible
+    atk = max(atk_lo, min(atk_hi, total - hp))
+    return atk, hp
+
+
 def _op_stat_redistribute(
     parent: dict[str, Any],
     constraints: dict[str, Any],
@@ -192,14 +220,11 @@ def _op_stat_redistribute(
     total = old_atk + old_hp
 
     # Random split
-    new_atk = rng.randint(atk_range[0], atk_range[1])
-    new_hp = total - new_atk
-
-    # Clamp hp
-    new_hp = max(hp_range[0], min(hp_range[1], new_hp))
-    # Recompute atk from clamped hp to maintain total if possible
-    new_atk = total - new_hp
-    new_atk = max(atk_range[0], min(atk_range[1], new_atk))
+    atk_lo, atk_hi = atk_range
+    hp_lo, hp_hi = hp_range
+    new_atk, new_hp = _split_total(
+        total, rng.randint(atk_lo, atk_hi), atk_lo, atk_hi, hp_lo, hp_hi,
+    )
 
     params = dict(parent["params"])
     params["atk"] = new_atk
@@ -229,6 +254,15 @@ _OPERATORS: dict[str, Any] = {
 # Single mutation
 # -------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
+def _cumulative_op_weights(
+    items: tuple[tuple[str, float], ...],
+) -> tuple[tuple[str, ...], tuple[float, ...]]:
+    """Sorted op names and their cumulative weights, built once per weight set."""
+    ops = tuple(op for op, _ in items)
+    return ops, tuple(itertools.accumulate(w for _, w in items))
+
+
 def mutate_candidate(
     parent: dict[str, Any],
     constraints: dict[str, Any],
@@ -242,10 +276,10 @@ def mutate_candidate(
     Returns a new candidate dict or None if all retries fail.
     """
     parent_id = parent["id"]
+    template_specs = constraints.get("templates", {})
 
     # Build weighted operator list
-    ops = sorted(op_weights.keys())
-    weights = [op_weights[o] for o in ops]
+    ops, cum_weights = _cumulative_op_weights(tuple(sorted(op_weights.items())))
 
     max_retries = 3
     for attempt in range(max_retries):
@@ -253,7 +287,7 @@ def mutate_candidate(
         rng = random.Random(mut_seed)
 
         # Select operator
-        chosen_op = rng.choices(ops, weights=weights, k=1)[0]
+        chosen_op = rng.choices(ops, cum_weights=cum_weights, k=1)[0]
         op_fn = _OPERATORS.get(chosen_op)
         if op_fn is None:
             continue
@@ -267,7 +301,6 @@ def mutate_candidate(
             continue
 
         # Build new candidate
-        template_specs = constraints.get("templates", {})
         spec = template_specs.get(result["template"], {})
 
         cid = _candidate_id(result["template"], result["params"], mut_seed)
@@ -333,48 +366,86 @@ def generate_mutations(
 # Distance function
 # -------------------------------------------------------------------------
 
-def card_distance(
-    a: dict[str, Any],
-    b: dict[str, Any],
-    constraints: dict[str, Any],
-) -> float:
-    """Compute distance between two candidates. Returns [0, 1]."""
+# Encoded candidate: (template, cost, params, spans). spans maps each param
+# of the candidate's own template to its range width (>= 1), or is None if
+# the template has no spec.
+EncodedCandidate = tuple[str, int, dict[str, Any], dict[str, int] | None]
+
+# Distance contributed by a template mismatch alone
+_TEMPLATE_MISMATCH_DISTANCE = 0.5
+
+
+def _encode_candidate(c: dict[str, Any], constraints: dict[str, Any]) -> EncodedCandidate:
+    """Precompute the fields card_distance needs for one candidate."""
+    spec = constraints.get("templates", {}).get(c["template"])
+    spans: dict[str, int] | None = None
+    if spec is not None:
+        spans = {
+            key: max(hi - lo, 1)
+            for key, (lo, hi) in spec.get("params_ranges", {}).items()
+        }
+    return (c["template"], c["cost"], c.get("params", {}), spans)
+
+
+def _encoded_distance(ea: EncodedCandidate, eb: EncodedCandidate) -> float:
+    """card_distance over pre-encoded candidates."""
+    tmpl_a, cost_a, params_a, spans_a = ea
+    tmpl_b, cost_b, params_b, spans_b = eb
     dist = 0.0
 
     # Template difference
-    if a["template"] != b["template"]:
-        dist += 0.5
+    if tmpl_a != tmpl_b:
+        dist += _TEMPLATE_MISMATCH_DISTANCE
 
     # Cost difference
-    dist += abs(a["cost"] - b["cost"]) / 10.0 * 0.2
+    dist += abs(cost_a - cost_b) / 10.0 * 0.2
 
     # Params difference (shared keys only, range-normalized)
-    params_a = a.get("params", {})
-    params_b = b.get("params", {})
-    common_keys = set(params_a.keys()) & set(params_b.keys())
-
+    common_keys = params_a.keys() & params_b.keys()
     if common_keys:
-        template_specs = constraints.get("templates", {})
         # Use template of a for ranges (fallback to b if not found)
-        spec = template_specs.get(a["template"], template_specs.get(b["template"], {}))
-        params_ranges = spec.get("params_ranges", {})
-
-        param_diffs: list[float] = []
+        spans = spans_a if spans_a is not None else (spans_b or {})
+        total = 0.0
         for key in sorted(common_keys):
-            lo, hi = params_ranges.get(key, [0, 1])
-            span = max(hi - lo, 1)
-            param_diffs.append(abs(params_a[key] - params_b[key]) / span)
-
-        if param_diffs:
-            dist += sum(param_diffs) / len(param_diffs) * 0.3
+            total += abs(params_a[key] - params_b[key]) / spans.get(key, 1)
+        dist += total / len(common_keys) * 0.3
 
     return max(0.0, min(1.0, dist))
 
 
+def card_distance(
+    a: dict[str, Any],
+    b: dict[str, Any],
+    constraints: dict[str, Any],
+) -> float:
+    """Compute distance between two candidates. Returns [0, 1]."""
+    if a is b:
+        return 0.0
+    return _encoded_distance(
+        _encode_candidate(a, constraints), _encode_candidate(b, constraints),
+    )
+
+
 # -------------------------------------------------------------------------
 # Diversity filter
 # -------------------------------------------------------------------------
 
+def _cap_per_template(
+    candidates: list[dict[str, Any]],
+    max_per_template: int,
+) -> list[dict[str, Any]]:
+    """Keep candidates in order, at most max_per_template per template."""
+    kept: list[dict[str, Any]] = []
+    template_counts: dict[str, int] = {}
+    for c in candidates:
+        tmpl = c["template"]
+        if template_counts.get(tmpl, 0) >= max_per_template:
+            continue
+        kept.append(c)
+        template_counts[tmpl] = template_counts.get(tmpl, 0) + 1
+    return kept
+
+
 def dedupe_and_filter_diversity(
     candidates: list[dict[str, Any]],
     constraints: dict[str, Any],
@@ -392,13 +463,10 @@ def dedupe_and_filter_diversity(
     max_per_template = div_cfg.get("max_per_template", 12)
 
     # 1. Deduplicate
-    seen: set[str] = set()
+    seen: set[tuple[Any, ...]] = set()
     deduped: list[dict[str, Any]] = []
     for c in candidates:
-        key = json.dumps(
-            {"template": c["template"], "params": c["params"], "cost": c["cost"]},
-            sort_keys=True,
-        )
+        key = (c["template"], tuple(sorted(c["params"].items())), c["cost"])
         if key not in seen:
             seen.add(key)
             deduped.append(c)
@@ -406,28 +474,36 @@ def dedupe_and_filter_diversity(
     # 2. Sort by id for deterministic order
     deduped.sort(key=lambda c: c["id"])
 
-    # 3. Greedy diversity filter
+    # Distances are never negative: with min_distance <= 0 only the
+    # per-template cap applies, so skip encoding and the pairwise scan.
+    if min_distance <= 0.0:
+        return _cap_per_template(deduped, max_per_template)
+
+    # 3. Greedy diversity filter (candidates encoded once, not per pair).
+    # Accepted encodings are bucketed by template: a template mismatch alone
+    # already reaches min_distance unless it is above 0.5, so in the common
+    # case only the candidate's own bucket needs scanning.
     accepted: list[dict[str, Any]] = []
-    template_counts: dict[str, int] = {}
+    accepted_enc: list[EncodedCandidate] = []
+    by_template: dict[str, list[EncodedCandidate]] = {}
+    same_template_only = min_distance <= _TEMPLATE_MISMATCH_DISTANCE
 
     for c in deduped:
         tmpl = c["template"]
+        bucket = by_template.setdefault(tmpl, [])
 
         # max_per_template check
-        if template_counts.get(tmpl, 0) >= max_per_template:
+        if len(bucket) >= max_per_template:
             continue
 
-        # min_distance check against all accepted
-        too_close = False
-        for a in accepted:
-            if card_distance(c, a, constraints) < min_distance:
-                too_close = True
-                break
-
-        if too_close:
+        # min_distance check against accepted
+        enc = _encode_candidate(c, constraints)
+        pool = bucket if same_template_only else accepted_enc
+        if any(_encoded_distance(enc, ea) < min_distance for ea in pool):
             continue
 
         accepted.append(c)
-        template_counts[tmpl] = template_counts.get(tmpl, 0) + 1
+        accepted_enc.append(enc)
+        bucket.append(enc)
 
     return accepted
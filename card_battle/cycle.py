@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import shutil
@@ -21,16 +22,30 @@ def _write_json(path: Path, data: Any) -> None:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+@functools.lru_cache(maxsize=1024)
 def _derive_cycle_seed(global_seed: int, cycle_index: int) -> int:
     """SHA-256 based deterministic seed for each cycle."""
     digest = hashlib.sha256(f"{global_seed}:{cycle_index}".encode()).digest()
     return int.from_bytes(digest[:8], "big")
 
 
+# (path, inode, size, mtime_ns) -> hex digest; a rewrite changes the stat key
+_pool_hash_cache: dict[tuple[str, int, int, int], str] = {}
+
+
 def _pool_hash(pool_path: Path) -> str:
-    """SHA-256 hex digest of a pool file."""
-    data = pool_path.read_bytes()
-    return hashlib.sha256(data).hexdigest()
+    """SHA-256 hex digest of a pool file (memoized on the file's stat)."""
+    st = pool_path.stat()
+    key = (str(pool_path), st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _pool_hash_cache.get(key)
+    if cached is None:
+        # Kept on SHA-256: final_pool_hash is persisted in cycle outputs, and
+        # with hardware SHA extensions it outpaces the stdlib BLAKE2b here.
+        # file_digest streams through a fixed buffer rather than read_bytes().
+        with open(pool_path, "rb") as f:
+            cached = hashlib.file_digest(f, "sha256").hexdigest()
+        _pool_hash_cache[key] = cached
+    return cached
 
 
 def _snapshot_pool(pool_path: Path, pools_dir: Path, index: int) -> Path:
@@ -159,8 +174,13 @@ def _capture_replays(
     target_paths: list[str | Path],
     cycle_seed: int,
     replay_config: dict[str, Any],
+    promo_report: dict[str, Any] | None = None,
 ) -> list[str]:
-    """Capture replay JSONL for cross-matchup pairs among top-K delta decks."""
+    """Capture replay JSONL for cross-matchup pairs among top-K delta decks.
+
+    promo_report, if given, is used instead of re-reading
+    cycle_dir/promote/promotion_report.json.
+    """
     from card_battle.ai import GreedyAI
     from card_battle.engine import init_game, run_game
     from card_battle.loader import load_cards, load_deck
@@ -171,12 +191,15 @@ def _capture_replays(
     replays_dir.mkdir(parents=True, exist_ok=True)
 
     # Read promotion report for delta
-    report_path = cycle_dir / "promote" / "promotion_report.json"
-    if not report_path.exists():
-        return []
+    if promo_report is not None:
+        report = promo_report
+    else:
+        report_path = cycle_dir / "promote" / "promotion_report.json"
+        if not report_path.exists():
+            return []
 
-    with open(report_path, encoding="utf-8") as f:
-        report = json.load(f)
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
 
     # Support new schema (delta.adapted preferred) and old schema (delta as flat dict)
     delta_raw = report.get("delta", {})
@@ -268,6 +291,7 @@ def run_cycle(
     # Initial pool snapshot
     current_pool = pool_path
     _snapshot_pool(current_pool, pools_dir, 0)
+    initial_hash = _pool_hash(current_pool)
 
     t_start = time.monotonic()
     cycle_results: list[dict[str, Any]] = []
@@ -314,6 +338,7 @@ def run_cycle(
         "gates_passed": gates_passed,
         "gates_failed": gates_failed,
         "total_cards_added": total_cards_added,
+        "initial_pool_hash": initial_hash,
         "final_pool_hash": final_hash,
         "cycles": cycle_results,
     }
@@ -340,6 +365,7 @@ def run_cycle(
         "gates_passed": gates_passed,
         "gates_failed": gates_failed,
         "total_cards_added": total_cards_added,
+        "initial_pool_hash": initial_hash,
         "final_pool_hash": final_hash,
         "elapsed_seconds": elapsed,
         "cycles": cycle_results,
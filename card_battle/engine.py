@@ -138,9 +138,9 @@ def _resolve_combat(
         if attacker is None:
             continue  # attacker died to spell or was removed
 
-        if a_uid in blocks:
+        b_uid = blocks.get(a_uid)
+        if b_uid is not None:
             # Blocked — mutual damage
-            b_uid = blocks[a_uid]
             blocker = defender_units.get(b_uid)
             if blocker is not None:
                 unit_damage[b_uid] += attacker.atk
@@ -174,17 +174,19 @@ def _resolve_combat(
     # Count deaths before removing (for telemetry/replay)
     atk_deaths = 0
     def_deaths = 0
-    # Remove dead units from both boards
-    for player in [active_player, defender_player]:
-        dead = [u for u in player.board if u.hp <= 0]
+    # Remove dead units from both boards in one pass (board order preserved)
+    for player in (active_player, defender_player):
+        board = player.board
+        dead = [u for u in board if u.hp <= 0]
+        if not dead:
+            continue
         if telemetry or replay:
             if player is active_player:
                 atk_deaths = len(dead)
             else:
                 def_deaths = len(dead)
-        for u in dead:
-            player.board.remove(u)
-            player.graveyard.append(u.card_id)
+        board[:] = [u for u in board if u.hp > 0]
+        player.graveyard.extend([u.card_id for u in dead])
 
     # Mark attackers as having attacked (can_attack = False)
     for a_uid in attackers:
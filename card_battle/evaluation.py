@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 from card_battle.ai import GreedyAI
@@ -14,6 +16,7 @@ from card_battle.telemetry import MatchTelemetry
 PolicyMix = dict[str, list[dict[str, Any]]]
 
 
+@functools.lru_cache(maxsize=65536)
 def derive_match_seed(
     global_seed: int,
     generation: int,
@@ -300,23 +303,39 @@ def evaluate_population(
     policy_mix: PolicyMix | None = None,
     save_turn_trace: bool = False,
     turn_trace_max_cards: int = 3,
+    workers: int = 1,
 ) -> list[tuple[DeckDef, float]] | tuple[list[tuple[DeckDef, float]], list[dict[str, Any]]]:
     """Evaluate all decks in a population against the elite pool.
 
+    With workers > 1, decks are evaluated in a process pool. Every match seed
+    is derived from its parameters and results are collected in population
+    order, so the output is identical to the sequential path.
+
     If collect_telemetry is True, returns (scored, all_summaries).
     """
     results: list[tuple[DeckDef, float]] = []
     all_summaries: list[dict[str, Any]] = []
 
-    for deck in population:
-        out = evaluate_deck_vs_pool(
-            deck, elite_pool, card_db,
-            global_seed, generation, matches_per_opponent,
-            collect_telemetry=collect_telemetry,
-            policy_mix=policy_mix,
-            save_turn_trace=save_turn_trace,
-            turn_trace_max_cards=turn_trace_max_cards,
-        )
+    evaluate = functools.partial(
+        evaluate_deck_vs_pool,
+        elite_pool=elite_pool,
+        card_db=card_db,
+        global_seed=global_seed,
+        generation=generation,
+        matches_per_opponent=matches_per_opponent,
+        collect_telemetry=collect_telemetry,
+        policy_mix=policy_mix,
+        save_turn_trace=save_turn_trace,
+        turn_trace_max_cards=turn_trace_max_cards,
+    )
+    n_workers = min(workers, len(population))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            outs = list(ex.map(evaluate, population))
+    else:
+        outs = [evaluate(deck) for deck in population]
+
+    for deck, out in zip(population, outs):
         if collect_telemetry:
             fitness, sums = out  # type: ignore[misc]
             all_summaries.extend(sums)
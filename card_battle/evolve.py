@@ -107,6 +107,7 @@ class EvolutionRunner:
         })
 
         policy_mix = cfg.evaluation.get("policies") if cfg.evaluation else None
+        workers = cfg.evaluation.get("workers", 1) if cfg.evaluation else 1
 
         for gen in range(cfg.generations):
             # 1. Evaluate
@@ -117,6 +118,7 @@ class EvolutionRunner:
                 policy_mix=policy_mix,
                 save_turn_trace=save_turn_trace,
                 turn_trace_max_cards=turn_trace_max_cards,
+                workers=workers,
             )
             if telemetry_on:
                 scored, gen_summaries = eval_out  # type: ignore[misc]
@@ -311,8 +313,10 @@ class EvolutionRunner:
 
     @staticmethod
     def _write_json(path: Path, data: Any) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encode in one pass and issue a single write, as cardgen._write_json.
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(buf)
 
     @staticmethod
     def _write_jsonl(path: Path, records: list[dict[str, Any]]) -> None:
@@ -8,6 +8,9 @@ from pathlib import Path
 from card_battle.models import Card, DeckDef, DeckEntry
 from card_battle.effects import EFFECT_REGISTRY
 
+_CARD_TYPES = frozenset({"unit", "spell"})
+_MIN_COST, _MAX_COST = 0, 10
+
 
 def load_cards(path: str | Path) -> dict[str, Card]:
     path = Path(path)
@@ -32,9 +35,11 @@ def load_cards(path: str | Path) -> dict[str, Card]:
 
 
 def validate_card(card: Card) -> None:
-    if card.cost < 0 or card.cost > 10:
-        raise ValueError(f"Card {card.id}: cost {card.cost} out of range [0,10]")
-    if card.card_type not in ("unit", "spell"):
+    if not _MIN_COST <= card.cost <= _MAX_COST:
+        raise ValueError(
+            f"Card {card.id}: cost {card.cost} out of range [{_MIN_COST},{_MAX_COST}]"
+        )
+    if card.card_type not in _CARD_TYPES:
         raise ValueError(f"Card {card.id}: invalid card_type '{card.card_type}'")
     if card.template not in EFFECT_REGISTRY:
         raise ValueError(f"Card {card.id}: unknown template '{card.template}'")
@@ -43,17 +48,33 @@ def validate_card(card: Card) -> None:
             raise ValueError(f"Card {card.id}: unit must have atk and hp in params")
 
 
-def load_deck(path: str | Path, card_db: dict[str, Card]) -> DeckDef:
-    path = Path(path)
-    with open(path, encoding="utf-8") as f:
-        raw = json.load(f)
+# (path, inode, size, mtime_ns) -> (deck_id, ((card_id, count), ...));
+# a rewrite changes the stat key
+_deck_file_cache: dict[tuple[str, int, int, int], tuple[str, tuple[tuple[str, int], ...]]] = {}
 
-    deck_id = raw["deck_id"]
+
+def _read_deck_file(path: Path) -> tuple[str, tuple[tuple[str, int], ...]]:
+    """Parse a deck file into (deck_id, pairs), memoized on the file's stat."""
+    st = path.stat()
+    key = (str(path), st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _deck_file_cache.get(key)
+    if cached is None:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        cached = (
+            raw["deck_id"],
+            tuple((e["card_id"], e["count"]) for e in raw["entries"]),
+        )
+        _deck_file_cache[key] = cached
+    return cached
+
+
+def load_deck(path: str | Path, card_db: dict[str, Card]) -> DeckDef:
+    # Only the parse is cached; card ids are validated against card_db each call.
+    deck_id, pairs = _read_deck_file(Path(path))
     entries: list[DeckEntry] = []
     total = 0
-    for e in raw["entries"]:
-        card_id = e["card_id"]
-        count = e["count"]
+    for card_id, count in pairs:
         if card_id not in card_db:
             raise ValueError(f"Deck {deck_id}: unknown card_id '{card_id}'")
         if count < 1 or count > 3:
@@ -21,6 +21,7 @@ for _prefix in _NUMERIC_PREFIXES:
     _NUMERIC_KEYS.add(f"p0_{_prefix}")
     _NUMERIC_KEYS.add(f"p1_{_prefix}")
 _NUMERIC_KEYS.add("total_turns")
+_SORTED_NUMERIC_KEYS: tuple[str, ...] = tuple(sorted(_NUMERIC_KEYS))
 
 
 def aggregate_match_summaries(
@@ -60,16 +61,15 @@ def _aggregate_group(summaries: list[dict[str, Any]]) -> dict[str, Any]:
     if not summaries:
         return {}
 
-    totals: dict[str, float] = defaultdict(float)
     count = len(summaries)
 
-    for s in summaries:
-        for key in _NUMERIC_KEYS:
-            if key in s:
-                totals[key] += float(s[key])
-
+    # One column pass per field (sorted, so agg keys come out in order)
     agg: dict[str, Any] = {}
-    for key, total in sorted(totals.items()):
+    for key in _SORTED_NUMERIC_KEYS:
+        values = [s[key] for s in summaries if key in s]
+        if not values:
+            continue
+        total = sum(map(float, values))
         agg[key] = {
             "sum": total,
             "mean": round(total / count, 4),
@@ -49,7 +49,7 @@ class DeckDef:
 # In-game instances
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class UnitInstance:
     uid: int
     card_id: str
@@ -57,14 +57,18 @@ class UnitInstance:
     hp: int
     can_attack: bool = False
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> UnitInstance:
+        # All fields are immutable scalars, so a flat copy is a deep copy.
+        return UnitInstance(self.uid, self.card_id, self.atk, self.hp, self.can_attack)
 
-@dataclass
+
+@dataclass(slots=True)
 class CombatState:
     attackers: list[int] = field(default_factory=list)       # attacker uids
     blocks: dict[int, int] = field(default_factory=dict)     # attacker_uid -> blocker_uid
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     hp: int = 20
     mana_max: int = 0
@@ -34,10 +34,10 @@ def counts_to_deck(deck_id: str, counts: DeckCounts) -> DeckDef:
 
 def validate_counts(counts: DeckCounts) -> bool:
     """Check if counts satisfy deck constraints (30 cards, 1-3 each)."""
-    total = sum(counts.values())
-    if total != DECK_SIZE:
+    values = counts.values()
+    if sum(values) != DECK_SIZE:
         return False
-    return all(1 <= c <= MAX_COPIES for c in counts.values())
+    return min(values) >= 1 and max(values) <= MAX_COPIES
 
 
 def swap_one(
@@ -61,8 +61,8 @@ def load_match_summaries(path: str | Path) -> Iterator[dict[str, Any]]:
     """Load match summaries from a JSONL file (streaming)."""
     with open(path, encoding="utf-8") as f:
         for line in f:
-            line = line.strip()
-            if line:
+            # json.loads tolerates the surrounding whitespace; only skip blanks
+            if not line.isspace():
                 yield json.loads(line)
 
 
@@ -71,17 +71,15 @@ def load_all_summaries_from_dir(artifact_dir: str | Path) -> list[dict[str, Any]
     artifact_dir = Path(artifact_dir)
     summaries: list[dict[str, Any]] = []
     for jsonl_path in sorted(artifact_dir.glob("gen_*_summaries.jsonl")):
-        for s in load_match_summaries(jsonl_path):
-            summaries.append(s)
+        summaries.extend(load_match_summaries(jsonl_path))
     return summaries
 
 
-def write_patterns(
+def _serialize_patterns(
     patterns: list[dict[str, Any]],
-    output_path: str | Path,
     meta: dict[str, Any],
-) -> None:
-    """Write pattern dictionary to JSON."""
+) -> dict[str, Any]:
+    """Build the patterns.json document (patterns in stable output order)."""
     # Stable sort: (-lift, -support, pattern_id)
     sorted_patterns = sorted(
         patterns,
@@ -91,10 +89,19 @@ def write_patterns(
             p["pattern_id"],
         ),
     )
-    data = {
+    return {
         "meta": meta,
         "patterns": sorted_patterns,
     }
+
+
+def write_patterns(
+    patterns: list[dict[str, Any]],
+    output_path: str | Path,
+    meta: dict[str, Any],
+) -> None:
+    """Write pattern dictionary to JSON."""
+    data = _serialize_patterns(patterns, meta)
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,21 @@
+"""Shared, read-only test data loaded once per process."""
+
+import functools
+import os
+
+from card_battle.loader import load_cards, load_deck
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
+
+
+@functools.lru_cache(maxsize=None)
+def cached_card_db(path):
+    return load_cards(path)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_deck(name):
+    """Load ``data/decks/<name>.json`` once; Card/DeckDef are frozen."""
+    return load_deck(os.path.join(DATA_DIR, "decks", f"{name}.json"),
+                     cached_card_db(CARDS_JSON))
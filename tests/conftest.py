@@ -0,0 +1,48 @@
+"""pytest configuration (run in parallel with ``pytest -n auto --dist loadfile``).
+
+``--dist loadfile`` keeps each module on one worker, so the module-level
+cached evolve/cycle runs that several test classes share are built once.
+
+A single test selected with ``-k`` runs fastest without worker start-up;
+pass ``-p no:xdist`` (or drop ``-n``) for those runs.
+
+The suite stays runnable with ``python3 -m unittest discover tests/``;
+this module is only picked up when pytest is the runner.
+"""
+
+import pytest
+
+from card_battle.cardgen import _baseline_for, generate_candidates
+
+# End-to-end pipeline tests: each owns its temp dirs and seeded RNGs, so
+# they are safe to spread across xdist workers.
+_INTEGRATION_CLASSES = {
+    ("test_cardgen.py", "TestEndToEndSmoke"),
+    ("test_cardmut.py", "TestRegressionMutOff"),
+    ("test_cardmut.py", "TestEndToEndSmoke"),
+    ("test_patterns.py", "TestEndToEndPipeline"),
+    ("test_patterns.py", "TestTurnTraceOff"),
+    ("test_promotion.py", "TestEndToEndSmoke"),
+    ("test_promotion.py", "TestDeterminism"),
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag the end-to-end pipeline classes with the ``integration`` marker."""
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if cls is None:
+            continue
+        if (item.path.name, cls.__name__) in _INTEGRATION_CLASSES:
+            item.add_marker(pytest.mark.integration)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cardgen_memos():
+    """Start every test with empty cardgen memos.
+
+    They are process-global, so a test that runs the pipeline twice would
+    otherwise compare a run against earlier cached results.
+    """
+    generate_candidates.cache_clear()
+    _baseline_for.cache_clear()
@@ -4,7 +4,7 @@ import random
 import unittest
 
 from card_battle.actions import EndTurn, GoToCombat, DeclareAttack, PlayCard
-from card_battle.ai import GreedyAI, RandomAI, SimpleAI, _evaluate
+from card_battle.ai import GreedyAI, RandomAI, SimpleAI, _evaluate, _sim_copy
 from card_battle.models import Card, CombatState, GameState, PlayerState, UnitInstance
 
 
@@ -51,6 +51,18 @@ class TestEvaluate(unittest.TestCase):
         self.assertLessEqual(score, -1000)
 
 
+class TestSimCopy(unittest.TestCase):
+    def test_shares_card_db_copies_state(self):
+        gs = _make_gs()
+        gs.players[0].board.append(UnitInstance(uid=1, card_id="soldier", atk=2, hp=2))
+        sim = _sim_copy(gs)
+        self.assertIs(sim.card_db, gs.card_db)
+        self.assertIsNot(sim.players[0], gs.players[0])
+        self.assertIsNot(sim.players[0].board[0], gs.players[0].board[0])
+        self.assertIsNot(sim.rng, gs.rng)
+        self.assertEqual(sim.rng.random(), gs.rng.random())
+
+
 class TestGreedyAI(unittest.TestCase):
     def test_prefers_bolt_over_end_turn(self):
         gs = _make_gs()
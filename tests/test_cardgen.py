@@ -1,11 +1,17 @@
 """Tests for v0.5: Card generation — constrained search + adoption test."""
 
+import copy
+import hashlib
+import itertools
 import json
 import os
+import subprocess
+import sys
 import tempfile
 import unittest
 
 from card_battle.cardgen import (
+    _baseline_for,
     _candidate_id,
     _check_forbid,
     adoption_test_one,
@@ -14,6 +20,7 @@ from card_battle.cardgen import (
     generate_candidates,
     run_cardgen,
 )
+from card_battle.evaluation import evaluate_targets
 from card_battle.loader import load_cards, load_deck
 from card_battle.models import Card, DeckDef, DeckEntry
 from card_battle.mutation import deck_to_counts
@@ -26,6 +33,15 @@ CONSTRAINTS_JSON = os.path.join(
 GENERATE_JSON = os.path.join(
     os.path.dirname(__file__), "..", "configs", "generate_v0_5.json",
 )
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# Reads (patterns, constraints, config) JSON on stdin, prints candidate ids
+_IDS_SCRIPT = """
+import json, sys
+from card_battle.cardgen import generate_candidates
+patterns, constraints, config = json.load(sys.stdin)
+print(json.dumps([c["id"] for c in generate_candidates(patterns, constraints, config)]))
+"""
 
 
 def _sample_patterns() -> list[dict]:
@@ -132,6 +148,18 @@ class TestCandidateId(unittest.TestCase):
         cid = _candidate_id("Vanilla", {"atk": 2, "hp": 3}, 42)
         self.assertTrue(cid.startswith("cand_"))
 
+    def test_matches_canonical_json_digest(self):
+        # IDs persist in run outputs; keep the original SHA-256 payload
+        for tmpl, params, seed in [
+            ("Vanilla", {"hp": 3, "atk": 2}, 42),
+            ("Draw", {"n": 1}, -12345678901),
+        ]:
+            canonical = json.dumps(
+                {"template": tmpl, "params": params, "seed": seed}, sort_keys=True,
+            )
+            expected = "cand_" + hashlib.sha256(canonical.encode("utf-8")).digest()[:8].hex()
+            self.assertEqual(_candidate_id(tmpl, params, seed), expected)
+
 
 class TestCheckForbid(unittest.TestCase):
     def test_no_rules(self):
@@ -169,11 +197,65 @@ class TestGenerateCandidates(unittest.TestCase):
         constraints = _sample_constraints()
         config = _sample_config()
         c1 = generate_candidates(patterns, constraints, config)
+        # Recompute rather than read back the memoized result
+        generate_candidates.cache_clear()
         c2 = generate_candidates(patterns, constraints, config)
         self.assertEqual(c1, c2)
 
+    def test_unserializable_config_skips_cache(self):
+        from card_battle.cardgen import _generate_candidates_cache
+
+        patterns = _sample_patterns()
+        constraints = _sample_constraints()
+        config = _sample_config()
+        expected = generate_candidates(patterns, constraints, config)
+        generate_candidates.cache_clear()
+        config["note"] = object()
+        self.assertEqual(generate_candidates(patterns, constraints, config), expected)
+        self.assertEqual(len(_generate_candidates_cache), 0)
+
+    def test_cache_is_bounded(self):
+        from card_battle.cardgen import _CACHE_MAX_ENTRIES, _generate_candidates_cache
+
+        patterns = _sample_patterns()
+        constraints = _sample_constraints()
+        for seed in range(_CACHE_MAX_ENTRIES + 5):
+            config = _sample_config()
+            config["seed"] = seed
+            generate_candidates(patterns, constraints, config)
+        self.assertLessEqual(len(_generate_candidates_cache), _CACHE_MAX_ENTRIES)
+
+    def test_cached_result_is_independent_copy(self):
+        patterns = _sample_patterns()
+        constraints = _sample_constraints()
+        config = _sample_config()
+        c1 = generate_candidates(patterns, constraints, config)
+        c1[0]["params"]["mutated"] = True
+        c2 = generate_candidates(patterns, constraints, config)
+        self.assertNotIn("mutated", c2[0]["params"])
+        generate_candidates.cache_clear()
+        c3 = generate_candidates(patterns, constraints, config)
+        self.assertEqual(c2, c3)
+
+    def test_ids_independent_of_hash_seed(self):
+        """Candidate ids must not depend on the process's str hash secret."""
+        inputs = json.dumps([_sample_patterns(), _sample_constraints(), _sample_config()])
+        ids = []
+        for hash_seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=REPO_ROOT)
+            proc = subprocess.run(
+                [sys.executable, "-c", _IDS_SCRIPT],
+                input=inputs, capture_output=True, text=True, env=env, check=True,
+            )
+            ids.append(json.loads(proc.stdout))
+        self.assertGreater(len(ids[0]), 0)
+        self.assertEqual(ids[0], ids[1])
+
     def test_respects_max_cards(self):
-        patterns = _sample_patterns() * 10  # Many patterns
+        # Many patterns, each an independent copy (no shared dict references)
+        patterns = list(itertools.chain.from_iterable(
+            copy.deepcopy(_sample_patterns()) for _ in range(10)
+        ))
         constraints = _sample_constraints()
         config = _sample_config()
         config["candidates_per_pattern"] = 5
@@ -203,26 +285,24 @@ class TestGenerateCandidates(unittest.TestCase):
         candidates = generate_candidates(patterns, constraints, config)
         keys = set()
         for c in candidates:
-            key = json.dumps(
-                {"template": c["template"], "params": c["params"], "cost": c["cost"]},
-                sort_keys=True,
-            )
+            key = (c["template"], tuple(sorted(c["params"].items())), c["cost"])
             self.assertNotIn(key, keys, f"Duplicate candidate: {key}")
             keys.add(key)
 
 
 class TestBuildDeckVariants(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db,
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = load_cards(CARDS_JSON)
+        cls.deck = load_deck(
+            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), cls.card_db,
         )
         # Add a test candidate card
-        self.cand_card = Card(
+        cls.cand_card = Card(
             id="test_cand", name="Test Cand", cost=2, card_type="spell",
             tags=("removal",), template="RemoveUnit", params={"max_hp": 3},
         )
-        self.card_db["test_cand"] = self.cand_card
+        cls.card_db["test_cand"] = cls.cand_card
 
     def test_returns_variants(self):
         variants = build_deck_variants(self.deck, "test_cand", self.card_db, 3)
@@ -253,10 +333,11 @@ class TestBuildDeckVariants(unittest.TestCase):
 
 
 class TestAdoptionTestOne(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.targets = [
-            load_deck(os.path.join(DATA_DIR, "decks", f), self.card_db)
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = load_cards(CARDS_JSON)
+        cls.targets = [
+            load_deck(os.path.join(DATA_DIR, "decks", f), cls.card_db)
             for f in ["aggro_rush.json", "control_mage.json", "midrange.json"]
         ]
 
@@ -303,6 +384,15 @@ class TestAdoptionTestOne(unittest.TestCase):
             r2["delta"]["overall_win_rate_delta"],
         )
 
+    def test_baseline_cached_matches_fresh(self):
+        """Cached baseline equals a fresh evaluation and is returned as a copy."""
+        config = _sample_config()
+        b1 = _baseline_for(self.targets, self.card_db, config, 42)
+        b1["win_rates_by_target"].clear()
+        b2 = _baseline_for(self.targets, self.card_db, config, 42)
+        fresh = evaluate_targets(self.targets, self.card_db, 42, 1, None)
+        self.assertEqual(b2, fresh)
+
 
 class TestCheckAcceptance(unittest.TestCase):
     def test_accepted(self):
@@ -403,6 +493,9 @@ class TestEndToEndSmoke(unittest.TestCase):
         """Same inputs → same card_candidates.json."""
         results = []
         for _ in range(2):
+            # Each run recomputes candidates and baselines instead of reading memos
+            generate_candidates.cache_clear()
+            _baseline_for.cache_clear()
             with tempfile.TemporaryDirectory() as tmpdir:
                 patterns = {
                     "meta": {"version": "0.4"},
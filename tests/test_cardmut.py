@@ -1,7 +1,10 @@
 """Tests for v0.6: Card mutation operators + diversity filter."""
 
+import functools
+import hashlib
 import json
 import os
+import random
 import tempfile
 import unittest
 
@@ -13,6 +16,7 @@ from card_battle.cardmut import (
     _op_param_jitter,
     _op_stat_redistribute,
     _op_template_swap_within_family,
+    _split_total,
     _swap_targets,
     card_distance,
     dedupe_and_filter_diversity,
@@ -28,6 +32,21 @@ from card_battle.cardgen import (
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 
+# Operator tests re-seed one shared Random from a cached pristine state
+# rather than constructing a fresh Mersenne Twister per seed.
+_SHARED_RNG = random.Random()
+
+
+@functools.lru_cache(maxsize=None)
+def _pristine_state(seed: int) -> tuple:
+    return random.Random(seed).getstate()
+
+
+def _seeded_rng(seed: int) -> random.Random:
+    """Return the shared RNG reset to the state of random.Random(seed)."""
+    _SHARED_RNG.setstate(_pristine_state(seed))
+    return _SHARED_RNG
+
 
 def _sample_constraints() -> dict:
     return {
@@ -161,6 +180,13 @@ def _sample_patterns() -> list[dict]:
     ]
 
 
+# Shared read-only fixtures. Tests that tweak a config or patterns list call
+# the builder functions above for a private copy instead.
+_CONSTRAINTS = _sample_constraints()
+_CONFIG_WITH_MUTATIONS = _sample_config_with_mutations()
+_PATTERNS = _sample_patterns()
+
+
 def _make_vanilla_candidate(atk=3, hp=4, cost=3) -> dict:
     cid = _candidate_id("Vanilla", {"atk": atk, "hp": hp}, 100)
     return {
@@ -246,10 +272,9 @@ class TestMutationSeed(unittest.TestCase):
 
 class TestParamJitter(unittest.TestCase):
     def test_changes_one_param(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_param_jitter(parent, constraints, rng)
         self.assertIsNotNone(result)
         # Exactly one param should differ by 1
@@ -261,12 +286,11 @@ class TestParamJitter(unittest.TestCase):
         self.assertEqual(diffs[changed[0]], 1)
 
     def test_stays_in_range(self):
-        import random
         # atk at max (6), hp at min (1) — jitter should clamp
         parent = _make_vanilla_candidate(atk=6, hp=1, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         for seed in range(50):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_param_jitter(parent, constraints, rng)
             if result is None:
                 continue
@@ -277,11 +301,21 @@ class TestParamJitter(unittest.TestCase):
             self.assertGreaterEqual(result["params"]["hp"], hp_lo)
             self.assertLessEqual(result["params"]["hp"], hp_hi)
 
+    def test_at_bounds_still_moves(self):
+        # atk at max, hp at min — only atk-1 / hp+1 are feasible
+        parent = _make_vanilla_candidate(atk=6, hp=1, cost=3)
+        constraints = _CONSTRAINTS
+        for seed in range(10):
+            result = _op_param_jitter(parent, constraints, _seeded_rng(seed))
+            self.assertIn(
+                (result["mutation_detail"]["key"], result["mutation_detail"]["delta"]),
+                [("atk", -1), ("hp", 1)],
+            )
+
     def test_cost_unchanged(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_param_jitter(parent, constraints, rng)
         self.assertEqual(result["cost"], parent["cost"])
 
@@ -292,11 +326,10 @@ class TestParamJitter(unittest.TestCase):
 
 class TestCostAdjust(unittest.TestCase):
     def test_cost_changes_by_one(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         for seed in range(50):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_cost_adjust(parent, constraints, rng)
             if result is None:
                 continue
@@ -305,12 +338,11 @@ class TestCostAdjust(unittest.TestCase):
         self.fail("No successful cost_adjust in 50 seeds")
 
     def test_cost_in_range(self):
-        import random
         # Cost at min (1)
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=1)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         for seed in range(50):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_cost_adjust(parent, constraints, rng)
             if result is None:
                 continue
@@ -319,11 +351,10 @@ class TestCostAdjust(unittest.TestCase):
             self.assertLessEqual(result["cost"], cost_hi)
 
     def test_param_compensation(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         for seed in range(100):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_cost_adjust(parent, constraints, rng)
             if result is None:
                 continue
@@ -342,34 +373,31 @@ class TestCostAdjust(unittest.TestCase):
 
 class TestTemplateSwap(unittest.TestCase):
     def test_swap_within_family(self):
-        import random
         # DamagePlayer -> OnPlayDamagePlayer
         parent = _make_damage_candidate(amount=3, cost=2)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_template_swap_within_family(parent, constraints, rng)
         self.assertIsNotNone(result)
         self.assertEqual(result["template"], "OnPlayDamagePlayer")
 
     def test_singleton_returns_none(self):
-        import random
         # HealSelf has no family
         cid = _candidate_id("HealSelf", {"amount": 3}, 100)
         parent = {
             "id": cid, "template": "HealSelf", "cost": 2,
             "params": {"amount": 3}, "card_type": "spell",
         }
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_template_swap_within_family(parent, constraints, rng)
         self.assertIsNone(result)
 
     def test_draw_family_swap(self):
-        import random
         # Draw -> OnPlayDraw
         parent = _make_draw_candidate(n=2, cost=3)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_template_swap_within_family(parent, constraints, rng)
         self.assertIsNotNone(result)
         self.assertEqual(result["template"], "OnPlayDraw")
@@ -379,10 +407,9 @@ class TestTemplateSwap(unittest.TestCase):
         self.assertIn("hp", result["params"])
 
     def test_params_in_range(self):
-        import random
         parent = _make_draw_candidate(n=2, cost=3)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_template_swap_within_family(parent, constraints, rng)
         if result is None:
             return
@@ -397,21 +424,27 @@ class TestTemplateSwap(unittest.TestCase):
 # =====================================================================
 
 class TestStatRedistribute(unittest.TestCase):
+    def test_split_total_clamps(self):
+        # Total 7, drawn atk 1 -> hp 6 fits
+        self.assertEqual(_split_total(7, 1, 1, 6, 1, 8), (1, 6))
+        # Total 12, drawn atk 1 -> hp clamped to 8, atk rises to 4
+        self.assertEqual(_split_total(12, 1, 1, 6, 1, 8), (4, 8))
+        # Total 16 exceeds both maxima: both clamp
+        self.assertEqual(_split_total(16, 2, 1, 6, 1, 8), (6, 8))
+
     def test_vanilla_only(self):
-        import random
         parent = _make_draw_candidate(n=2, cost=3)
-        constraints = _sample_constraints()
-        rng = random.Random(42)
+        constraints = _CONSTRAINTS
+        rng = _seeded_rng(42)
         result = _op_stat_redistribute(parent, constraints, rng)
         self.assertIsNone(result)
 
     def test_total_preserved_or_close(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         old_total = parent["params"]["atk"] + parent["params"]["hp"]
         for seed in range(50):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_stat_redistribute(parent, constraints, rng)
             if result is None:
                 continue
@@ -422,11 +455,10 @@ class TestStatRedistribute(unittest.TestCase):
         self.fail("No successful stat_redistribute in 50 seeds")
 
     def test_stays_in_range(self):
-        import random
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         for seed in range(50):
-            rng = random.Random(seed)
+            rng = _seeded_rng(seed)
             result = _op_stat_redistribute(parent, constraints, rng)
             if result is None:
                 continue
@@ -445,7 +477,7 @@ class TestStatRedistribute(unittest.TestCase):
 class TestMutateCandidate(unittest.TestCase):
     def test_returns_valid_candidate(self):
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         op_weights = {
             "param_jitter": 0.45, "cost_adjust": 0.25,
             "template_swap_within_family": 0.15, "stat_redistribute": 0.15,
@@ -460,7 +492,7 @@ class TestMutateCandidate(unittest.TestCase):
 
     def test_lineage_correct(self):
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         op_weights = {"param_jitter": 1.0}
         result = mutate_candidate(parent, constraints, 42, 0, op_weights, [])
         self.assertIsNotNone(result)
@@ -472,27 +504,31 @@ class TestMutateCandidate(unittest.TestCase):
 
     def test_respects_forbid(self):
         parent = _make_vanilla_candidate(atk=5, hp=5, cost=2)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         # This forbid rule would catch the parent-like cards
         forbid = [{"template": "Vanilla", "condition": "atk + hp >= cost * 3 + 2"}]
+        forbid_code = compile(forbid[0]["condition"], "<forbid>", "eval")
+        safe_globals = {"__builtins__": {}}
         op_weights = {"param_jitter": 1.0}
         # Most mutations of this parent would still be forbidden
         results = []
+        ns: dict = {}
         for i in range(20):
             r = mutate_candidate(parent, constraints, 42, i, op_weights, forbid)
             if r is not None:
                 # Verify the result doesn't violate forbid
-                ns = dict(r["params"])
+                ns.clear()
+                ns.update(r["params"])
                 ns["cost"] = r["cost"]
                 self.assertFalse(
-                    eval("atk + hp >= cost * 3 + 2", {"__builtins__": {}}, ns),
+                    eval(forbid_code, safe_globals, ns),
                     f"Mutant violates forbid: {r['params']}, cost={r['cost']}",
                 )
                 results.append(r)
 
     def test_constraints_respected(self):
         parent = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         op_weights = {
             "param_jitter": 0.45, "cost_adjust": 0.25,
             "template_swap_within_family": 0.15, "stat_redistribute": 0.15,
@@ -522,14 +558,14 @@ class TestGenerateMutations(unittest.TestCase):
             _make_vanilla_candidate(atk=3, hp=4, cost=3),
             _make_draw_candidate(n=2, cost=3),
         ]
-        constraints = _sample_constraints()
-        config = _sample_config_with_mutations()
+        constraints = _CONSTRAINTS
+        config = _CONFIG_WITH_MUTATIONS
         mutated = generate_mutations(parents, constraints, config)
         self.assertGreater(len(mutated), 0)
 
     def test_per_base_limit(self):
         parents = [_make_vanilla_candidate(atk=3, hp=4, cost=3)]
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config = _sample_config_with_mutations()
         config["mutations"]["per_base"] = 2
         mutated = generate_mutations(parents, constraints, config)
@@ -541,8 +577,8 @@ class TestGenerateMutations(unittest.TestCase):
             _make_vanilla_candidate(atk=3, hp=4, cost=3),
             _make_damage_candidate(amount=3, cost=2),
         ]
-        constraints = _sample_constraints()
-        config = _sample_config_with_mutations()
+        constraints = _CONSTRAINTS
+        config = _CONFIG_WITH_MUTATIONS
         mutated = generate_mutations(parents, constraints, config)
         for m in mutated:
             self.assertIn("lineage", m)
@@ -558,20 +594,20 @@ class TestGenerateMutations(unittest.TestCase):
 class TestCardDistance(unittest.TestCase):
     def test_identical_zero(self):
         a = _make_vanilla_candidate(atk=3, hp=4, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         self.assertAlmostEqual(card_distance(a, a, constraints), 0.0)
 
     def test_different_template_at_least_half(self):
         a = _make_vanilla_candidate(atk=3, hp=4, cost=3)
         b = _make_draw_candidate(n=2, cost=3)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         d = card_distance(a, b, constraints)
         self.assertGreaterEqual(d, 0.5)
 
     def test_symmetric(self):
         a = _make_vanilla_candidate(atk=3, hp=4, cost=3)
         b = _make_vanilla_candidate(atk=5, hp=2, cost=4)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         self.assertAlmostEqual(
             card_distance(a, b, constraints),
             card_distance(b, a, constraints),
@@ -580,7 +616,7 @@ class TestCardDistance(unittest.TestCase):
     def test_range_zero_to_one(self):
         a = _make_vanilla_candidate(atk=1, hp=1, cost=1)
         b = _make_draw_candidate(n=3, cost=5)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         d = card_distance(a, b, constraints)
         self.assertGreaterEqual(d, 0.0)
         self.assertLessEqual(d, 1.0)
@@ -588,7 +624,7 @@ class TestCardDistance(unittest.TestCase):
     def test_cost_contributes(self):
         a = _make_vanilla_candidate(atk=3, hp=4, cost=1)
         b = _make_vanilla_candidate(atk=3, hp=4, cost=6)
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         d = card_distance(a, b, constraints)
         self.assertGreater(d, 0.0)
 
@@ -601,7 +637,7 @@ class TestDiversityFilter(unittest.TestCase):
     def test_removes_duplicates(self):
         a = _make_vanilla_candidate(atk=3, hp=4, cost=3)
         b = _make_vanilla_candidate(atk=3, hp=4, cost=3)  # identical
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config = {"diversity": {"min_distance": 0.0, "max_per_template": 100}}
         result = dedupe_and_filter_diversity([a, b], constraints, config)
         self.assertEqual(len(result), 1)
@@ -610,7 +646,7 @@ class TestDiversityFilter(unittest.TestCase):
         candidates = [
             _make_vanilla_candidate(atk=i, hp=4, cost=3) for i in range(1, 7)
         ]
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config_low = {"diversity": {"min_distance": 0.01, "max_per_template": 100}}
         config_high = {"diversity": {"min_distance": 0.3, "max_per_template": 100}}
         low_result = dedupe_and_filter_diversity(candidates, constraints, config_low)
@@ -622,7 +658,7 @@ class TestDiversityFilter(unittest.TestCase):
             _make_vanilla_candidate(atk=i, hp=j, cost=3)
             for i in range(1, 6) for j in range(1, 6)
         ]
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config = {"diversity": {"min_distance": 0.0, "max_per_template": 3}}
         result = dedupe_and_filter_diversity(candidates, constraints, config)
         template_counts = {}
@@ -636,7 +672,7 @@ class TestDiversityFilter(unittest.TestCase):
         candidates = [
             _make_vanilla_candidate(atk=i, hp=4, cost=3) for i in range(1, 6)
         ]
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config = {"diversity": {"min_distance": 0.1, "max_per_template": 10}}
         r1 = dedupe_and_filter_diversity(candidates, constraints, config)
         r2 = dedupe_and_filter_diversity(candidates, constraints, config)
@@ -649,9 +685,9 @@ class TestDiversityFilter(unittest.TestCase):
 
 class TestLineage(unittest.TestCase):
     def test_base_lineage(self):
-        patterns = _sample_patterns()
-        constraints = _sample_constraints()
-        config = _sample_config_with_mutations()
+        patterns = _PATTERNS
+        constraints = _CONSTRAINTS
+        config = _CONFIG_WITH_MUTATIONS
         candidates = generate_candidates(patterns, constraints, config)
         for c in candidates:
             self.assertIn("lineage", c)
@@ -662,8 +698,8 @@ class TestLineage(unittest.TestCase):
 
     def test_mutated_lineage(self):
         parents = [_make_vanilla_candidate(atk=3, hp=4, cost=3)]
-        constraints = _sample_constraints()
-        config = _sample_config_with_mutations()
+        constraints = _CONSTRAINTS
+        config = _CONFIG_WITH_MUTATIONS
         mutated = generate_mutations(parents, constraints, config)
         for m in mutated:
             lineage = m["lineage"]
@@ -680,28 +716,33 @@ class TestLineage(unittest.TestCase):
 # TestDeterminism
 # =====================================================================
 
+def _mutations_digest(mutations: list[dict]) -> bytes:
+    """Content hash of a mutation list (canonical JSON per entry, in order)."""
+    h = hashlib.blake2b(digest_size=16)
+    for m in mutations:
+        h.update(json.dumps(m, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        h.update(b"\n")
+    return h.digest()
+
+
 class TestDeterminism(unittest.TestCase):
     def test_same_seed_same_mutations(self):
         parents = [
             _make_vanilla_candidate(atk=3, hp=4, cost=3),
             _make_draw_candidate(n=2, cost=3),
         ]
-        constraints = _sample_constraints()
-        config = _sample_config_with_mutations()
+        constraints = _CONSTRAINTS
+        config = _CONFIG_WITH_MUTATIONS
 
         m1 = generate_mutations(parents, constraints, config)
         m2 = generate_mutations(parents, constraints, config)
 
         self.assertEqual(len(m1), len(m2))
-        for a, b in zip(m1, m2):
-            self.assertEqual(a["id"], b["id"])
-            self.assertEqual(a["template"], b["template"])
-            self.assertEqual(a["params"], b["params"])
-            self.assertEqual(a["cost"], b["cost"])
+        self.assertEqual(_mutations_digest(m1), _mutations_digest(m2))
 
     def test_different_seed_different_mutations(self):
         parents = [_make_vanilla_candidate(atk=3, hp=4, cost=3)]
-        constraints = _sample_constraints()
+        constraints = _CONSTRAINTS
         config1 = _sample_config_with_mutations()
         config1["seed"] = 42
         config2 = _sample_config_with_mutations()
@@ -717,166 +758,180 @@ class TestDeterminism(unittest.TestCase):
             self.assertNotEqual(ids1, ids2)
 
 
+# =====================================================================
+# Pipeline fixtures
+# =====================================================================
+
+def _dump_json(path: str, obj) -> None:
+    """Encode compactly in memory and write the bytes in one call."""
+    with open(path, "wb") as f:
+        f.write(json.dumps(obj, separators=(",", ":")).encode("utf-8"))
+
+
+def _load_json(path: str):
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _write_pipeline_inputs(tmpdir: str) -> tuple[str, str]:
+    """Write the static patterns.json / constraints.json once per class."""
+    pat_path = os.path.join(tmpdir, "patterns.json")
+    _dump_json(pat_path, {"meta": {"version": "0.4"}, "patterns": _PATTERNS})
+    con_path = os.path.join(tmpdir, "constraints.json")
+    _dump_json(con_path, _CONSTRAINTS)
+    return pat_path, con_path
+
+
+class _PipelineTestCase(unittest.TestCase):
+    """Shares one temp dir and the static pipeline inputs across a class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.pat_path, cls.con_path = _write_pipeline_inputs(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self._outputs: dict[str, object] = {}
+
+    def _test_dir(self) -> str:
+        path = os.path.join(self._tmp.name, self._testMethodName)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _output(self, out_dir: str, name: str):
+        """Parsed output file, loaded at most once per test."""
+        path = os.path.join(out_dir, name)
+        if path not in self._outputs:
+            self._outputs[path] = _load_json(path)
+        return self._outputs[path]
+
+    def _write_config(self, config: dict) -> str:
+        cfg_path = os.path.join(self._test_dir(), "config.json")
+        _dump_json(cfg_path, config)
+        return cfg_path
+
+
 # =====================================================================
 # TestRegressionMutOff
 # =====================================================================
 
-class TestRegressionMutOff(unittest.TestCase):
+class TestRegressionMutOff(_PipelineTestCase):
     def test_mutations_off_produces_base_only(self):
         """With mutations disabled, run_cardgen should produce only base candidates."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            patterns = {"meta": {"version": "0.4"}, "patterns": _sample_patterns()}
-            pat_path = os.path.join(tmpdir, "patterns.json")
-            with open(pat_path, "w") as f:
-                json.dump(patterns, f)
-
-            constraints = _sample_constraints()
-            con_path = os.path.join(tmpdir, "constraints.json")
-            with open(con_path, "w") as f:
-                json.dump(constraints, f)
-
-            config = _sample_config_with_mutations()
-            config["mutations"]["enabled"] = False
-            config["top_patterns_per_type"] = {"counter": 1, "sequence": 1, "cooccurrence": 0}
-            config["candidates_per_pattern"] = 1
-            cfg_path = os.path.join(tmpdir, "config.json")
-            with open(cfg_path, "w") as f:
-                json.dump(config, f)
-
-            out_dir = os.path.join(tmpdir, "output")
-            target_paths = [
-                os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                os.path.join(DATA_DIR, "decks", "control_mage.json"),
-                os.path.join(DATA_DIR, "decks", "midrange.json"),
-            ]
-
-            result = run_cardgen(
-                patterns_path=pat_path,
-                pool_path=CARDS_JSON,
-                target_paths=target_paths,
-                constraints_path=con_path,
-                config_path=cfg_path,
-                output_dir=out_dir,
-            )
+        config = _sample_config_with_mutations()
+        config["mutations"]["enabled"] = False
+        config["top_patterns_per_type"] = {"counter": 1, "sequence": 1, "cooccurrence": 0}
+        config["candidates_per_pattern"] = 1
+        cfg_path = self._write_config(config)
+
+        out_dir = os.path.join(self._test_dir(), "output")
+        target_paths = [
+            os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
+            os.path.join(DATA_DIR, "decks", "control_mage.json"),
+            os.path.join(DATA_DIR, "decks", "midrange.json"),
+        ]
+
+        result = run_cardgen(
+            patterns_path=self.pat_path,
+            pool_path=CARDS_JSON,
+            target_paths=target_paths,
+            constraints_path=self.con_path,
+            config_path=cfg_path,
+            output_dir=out_dir,
+        )
 
-            self.assertEqual(result["total_mutated"], 0)
-            self.assertEqual(result["total_candidates"], result["total_base"])
+        self.assertEqual(result["total_mutated"], 0)
+        self.assertEqual(result["total_candidates"], result["total_base"])
 
-            # All candidates should have base lineage
-            with open(os.path.join(out_dir, "card_candidates.json")) as f:
-                candidates = json.load(f)
-            for c in candidates:
-                self.assertEqual(c["lineage"]["origin"], "base")
+        # All candidates should have base lineage
+        candidates = self._output(out_dir, "card_candidates.json")
+        for c in candidates:
+            self.assertEqual(c["lineage"]["origin"], "base")
 
     def test_mutations_off_via_override(self):
         """CLI --mutations off should override config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            patterns = {"meta": {"version": "0.4"}, "patterns": _sample_patterns()}
-            pat_path = os.path.join(tmpdir, "patterns.json")
-            with open(pat_path, "w") as f:
-                json.dump(patterns, f)
-
-            constraints = _sample_constraints()
-            con_path = os.path.join(tmpdir, "constraints.json")
-            with open(con_path, "w") as f:
-                json.dump(constraints, f)
-
-            config = _sample_config_with_mutations()
-            # Config says enabled=True, but override says off
-            config["mutations"]["enabled"] = True
-            config["top_patterns_per_type"] = {"counter": 1, "sequence": 0, "cooccurrence": 0}
-            config["candidates_per_pattern"] = 1
-            cfg_path = os.path.join(tmpdir, "config.json")
-            with open(cfg_path, "w") as f:
-                json.dump(config, f)
-
-            out_dir = os.path.join(tmpdir, "output")
-            target_paths = [
-                os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                os.path.join(DATA_DIR, "decks", "control_mage.json"),
-            ]
-
-            result = run_cardgen(
-                patterns_path=pat_path,
-                pool_path=CARDS_JSON,
-                target_paths=target_paths,
-                constraints_path=con_path,
-                config_path=cfg_path,
-                output_dir=out_dir,
-                mutations_override="off",
-            )
+        config = _sample_config_with_mutations()
+        # Config says enabled=True, but override says off
+        config["mutations"]["enabled"] = True
+        config["top_patterns_per_type"] = {"counter": 1, "sequence": 0, "cooccurrence": 0}
+        config["candidates_per_pattern"] = 1
+        cfg_path = self._write_config(config)
+
+        out_dir = os.path.join(self._test_dir(), "output")
+        target_paths = [
+            os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
+            os.path.join(DATA_DIR, "decks", "control_mage.json"),
+        ]
 
-            self.assertEqual(result["total_mutated"], 0)
+        result = run_cardgen(
+            patterns_path=self.pat_path,
+            pool_path=CARDS_JSON,
+            target_paths=target_paths,
+            constraints_path=self.con_path,
+            config_path=cfg_path,
+            output_dir=out_dir,
+            mutations_override="off",
+        )
+
+        self.assertEqual(result["total_mutated"], 0)
 
 
 # =====================================================================
 # TestEndToEndSmoke
 # =====================================================================
 
-class TestEndToEndSmoke(unittest.TestCase):
+class TestEndToEndSmoke(_PipelineTestCase):
     def test_v06_pipeline_completes(self):
         """Full v0.6 pipeline with mutations and diversity."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            patterns = {"meta": {"version": "0.4"}, "patterns": _sample_patterns()}
-            pat_path = os.path.join(tmpdir, "patterns.json")
-            with open(pat_path, "w") as f:
-                json.dump(patterns, f)
-
-            constraints = _sample_constraints()
-            con_path = os.path.join(tmpdir, "constraints.json")
-            with open(con_path, "w") as f:
-                json.dump(constraints, f)
-
-            config = _sample_config_with_mutations()
-            config["top_patterns_per_type"] = {"counter": 2, "sequence": 1, "cooccurrence": 1}
-            config["candidates_per_pattern"] = 2
-            # Lower min_distance to keep more mutated candidates through filter
-            config["diversity"]["min_distance"] = 0.05
-            cfg_path = os.path.join(tmpdir, "config.json")
-            with open(cfg_path, "w") as f:
-                json.dump(config, f)
-
-            out_dir = os.path.join(tmpdir, "output")
-            target_paths = [
-                os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                os.path.join(DATA_DIR, "decks", "control_mage.json"),
-                os.path.join(DATA_DIR, "decks", "midrange.json"),
-            ]
-
-            result = run_cardgen(
-                patterns_path=pat_path,
-                pool_path=CARDS_JSON,
-                target_paths=target_paths,
-                constraints_path=con_path,
-                config_path=cfg_path,
-                output_dir=out_dir,
-            )
+        config = _sample_config_with_mutations()
+        config["top_patterns_per_type"] = {"counter": 2, "sequence": 1, "cooccurrence": 1}
+        config["candidates_per_pattern"] = 2
+        # Lower min_distance to keep more mutated candidates through filter
+        config["diversity"]["min_distance"] = 0.05
+        cfg_path = self._write_config(config)
+
+        out_dir = os.path.join(self._test_dir(), "output")
+        target_paths = [
+            os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
+            os.path.join(DATA_DIR, "decks", "control_mage.json"),
+            os.path.join(DATA_DIR, "decks", "midrange.json"),
+        ]
+
+        result = run_cardgen(
+            patterns_path=self.pat_path,
+            pool_path=CARDS_JSON,
+            target_paths=target_paths,
+            constraints_path=self.con_path,
+            config_path=cfg_path,
+            output_dir=out_dir,
+        )
 
-            # Check outputs exist
-            self.assertTrue(os.path.exists(os.path.join(out_dir, "card_candidates.json")))
-            self.assertTrue(os.path.exists(os.path.join(out_dir, "adoption_report.json")))
-            self.assertTrue(os.path.exists(os.path.join(out_dir, "selected_cards.json")))
-            self.assertTrue(os.path.exists(os.path.join(out_dir, "run_meta.json")))
-
-            # Check counts
-            self.assertGreater(result["total_candidates"], 0)
-            self.assertGreater(result["total_base"], 0)
-            self.assertGreater(result["total_mutated"], 0)
-            self.assertGreater(result["total_after_diversity"], 0)
-
-            # run_meta has new fields
-            with open(os.path.join(out_dir, "run_meta.json")) as f:
-                meta = json.load(f)
-            self.assertIn("total_base", meta)
-            self.assertIn("total_mutated", meta)
-            self.assertIn("total_after_diversity", meta)
-
-            # Candidates include both base and mutated
-            with open(os.path.join(out_dir, "card_candidates.json")) as f:
-                candidates = json.load(f)
-            origins = {c["lineage"]["origin"] for c in candidates}
-            self.assertIn("base", origins)
-            self.assertIn("mutated", origins)
+        # Check outputs exist
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "card_candidates.json")))
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "adoption_report.json")))
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "selected_cards.json")))
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "run_meta.json")))
+
+        # Check counts
+        self.assertGreater(result["total_candidates"], 0)
+        self.assertGreater(result["total_base"], 0)
+        self.assertGreater(result["total_mutated"], 0)
+        self.assertGreater(result["total_after_diversity"], 0)
+
+        # run_meta has new fields
+        meta = self._output(out_dir, "run_meta.json")
+        self.assertIn("total_base", meta)
+        self.assertIn("total_mutated", meta)
+        self.assertIn("total_after_diversity", meta)
+
+        # Candidates include both base and mutated
+        candidates = self._output(out_dir, "card_candidates.json")
+        self.assertTrue(any(c["lineage"]["origin"] == "base" for c in candidates))
+        self.assertTrue(any(c["lineage"]["origin"] == "mutated" for c in candidates))
 
 
 # =====================================================================
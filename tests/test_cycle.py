@@ -1,11 +1,15 @@
 """Tests for v0.7.1: Cycle runner."""
 
+import filecmp
+import functools
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
+from card_battle.cardgen import _baseline_for, generate_candidates
 from card_battle.cycle import _capture_replays, _derive_cycle_seed, _pool_hash, run_cycle
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
@@ -18,9 +22,14 @@ TARGET_PATHS = [
 ]
 
 
-def _make_cycle_config(tmpdir: str, cycles: int = 1, seed: int = 42,
-                        replay_enabled: bool = False) -> str:
-    """Write a small cycle config for testing (fast evolve settings)."""
+# Stands in for the per-test tmpdir in the cached config JSON text
+_TMPDIR_PLACEHOLDER = "@TMPDIR@"
+
+
+@functools.lru_cache(maxsize=None)
+def _cycle_config_texts(cycles: int, seed: int, replay_enabled: bool) -> tuple[str, str]:
+    """Serialized (evolve, cycle) configs with a tmpdir placeholder, built once."""
+    tmpdir = _TMPDIR_PLACEHOLDER
     # Small evolve config: 2 generations, 6 population, 1 match
     evolve_cfg = {
         "global_seed": seed,
@@ -44,8 +53,6 @@ def _make_cycle_config(tmpdir: str, cycles: int = 1, seed: int = 42,
         "evaluation": {},
     }
     evolve_path = os.path.join(tmpdir, "evolve_test.json")
-    with open(evolve_path, "w") as f:
-        json.dump(evolve_cfg, f)
 
     cycle_cfg = {
         "version": "0.6.1-test",
@@ -65,9 +72,22 @@ def _make_cycle_config(tmpdir: str, cycles: int = 1, seed: int = 42,
             "top_k_matchups": 2,
         },
     }
+    return json.dumps(evolve_cfg), json.dumps(cycle_cfg)
+
+
+def _make_cycle_config(tmpdir: str, cycles: int = 1, seed: int = 42,
+                        replay_enabled: bool = False) -> str:
+    """Write a small cycle config for testing (fast evolve settings)."""
+    evolve_text, cycle_text = _cycle_config_texts(cycles, seed, replay_enabled)
+    # Substitute the JSON-escaped tmpdir (without its surrounding quotes)
+    escaped = json.dumps(tmpdir)[1:-1]
+    Path(tmpdir, "evolve_test.json").write_text(
+        evolve_text.replace(_TMPDIR_PLACEHOLDER, escaped), encoding="utf-8",
+    )
     config_path = os.path.join(tmpdir, "cycle_test.json")
-    with open(config_path, "w") as f:
-        json.dump(cycle_cfg, f)
+    Path(config_path).write_text(
+        cycle_text.replace(_TMPDIR_PLACEHOLDER, escaped), encoding="utf-8",
+    )
     return config_path
 
 
@@ -124,48 +144,82 @@ class TestPoolHash(unittest.TestCase):
             p1.unlink()
             p2.unlink()
 
+    def test_rewrite_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p = Path(tmpdir) / "pool.json"
+            p.write_text('[{"id": "a"}]')
+            before = _pool_hash(p)
+            st = p.stat()
+            p.write_text('[{"id": "b"}]')
+            # Same size; force a distinct mtime so the stat key changes
+            os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            self.assertNotEqual(_pool_hash(p), before)
+
+
+# One seed-42, single-cycle run shared by the read-only smoke and gate tests;
+# TestCycleDeterminism separately checks that repeated runs agree.
+_SHARED_CYCLE_TMPDIRS: list[str] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_cycle_run() -> tuple[dict, str]:
+    """run_cycle(cycles=1, seed=42) once per module; returns (result, output_dir)."""
+    tmpdir = tempfile.mkdtemp()
+    _SHARED_CYCLE_TMPDIRS.append(tmpdir)
+    config_path = _make_cycle_config(tmpdir, cycles=1, seed=42)
+    output_dir = os.path.join(tmpdir, "out")
+    result = run_cycle(config_path=config_path, output_dir=output_dir)
+    return result, output_dir
+
+
+def tearDownModule():
+    for tmpdir in _SHARED_CYCLE_TMPDIRS:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
 
 class TestCycleSmoke(unittest.TestCase):
     """Smoke test: 1 cycle completes and produces expected artifacts."""
 
     def test_single_cycle_completes(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = _make_cycle_config(tmpdir, cycles=1, seed=42)
-            output_dir = os.path.join(tmpdir, "out")
+        result, output_dir = _shared_cycle_run()
 
-            result = run_cycle(config_path=config_path, output_dir=output_dir)
-
-            # Basic structure
-            self.assertEqual(result["total_cycles"], 1)
-            self.assertIn("gates_passed", result)
-            self.assertIn("gates_failed", result)
-            self.assertEqual(result["gates_passed"] + result["gates_failed"], 1)
-            self.assertIn("elapsed_seconds", result)
-            self.assertIn("final_pool_hash", result)
-            self.assertEqual(len(result["cycles"]), 1)
+        # Basic structure
+        self.assertEqual(result["total_cycles"], 1)
+        self.assertIn("gates_passed", result)
+        self.assertIn("gates_failed", result)
+        self.assertEqual(result["gates_passed"] + result["gates_failed"], 1)
+        self.assertIn("elapsed_seconds", result)
+        self.assertIn("initial_pool_hash", result)
+        self.assertIn("final_pool_hash", result)
+        self.assertEqual(len(result["cycles"]), 1)
 
-            # Artifact directories
-            out = Path(output_dir)
-            self.assertTrue((out / "cycle_summary.json").exists())
-            self.assertTrue((out / "run_meta.json").exists())
-            self.assertTrue((out / "pools" / "pool_000.json").exists())
-            self.assertTrue((out / "pools" / "pool_001.json").exists())
-            self.assertTrue((out / "cycles" / "cycle_000").is_dir())
+        # Artifact directories
+        out = Path(output_dir)
+        self.assertTrue((out / "cycle_summary.json").exists())
+        self.assertTrue((out / "run_meta.json").exists())
+        self.assertTrue((out / "pools" / "pool_000.json").exists())
+        self.assertTrue((out / "pools" / "pool_001.json").exists())
+        self.assertTrue((out / "cycles" / "cycle_000").is_dir())
 
-            # Evolve artifacts
-            cycle_dir = out / "cycles" / "cycle_000"
-            self.assertTrue((cycle_dir / "evolve").is_dir())
+        # Evolve artifacts
+        cycle_dir = out / "cycles" / "cycle_000"
+        self.assertTrue((cycle_dir / "evolve").is_dir())
 
-            # Patterns artifact
-            self.assertTrue((cycle_dir / "patterns.json").exists())
+        # Patterns artifact
+        self.assertTrue((cycle_dir / "patterns.json").exists())
 
-            # Cardgen dir
-            self.assertTrue((cycle_dir / "cardgen").is_dir())
+        # Cardgen dir
+        self.assertTrue((cycle_dir / "cardgen").is_dir())
 
 
 class TestCycleDeterminism(unittest.TestCase):
     """Same seed → identical cycle_summary (except elapsed_seconds)."""
 
+    def setUp(self):
+        # cardgen memos are process-global; start from empty ones
+        generate_candidates.cache_clear()
+        _baseline_for.cache_clear()
+
     def test_deterministic(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_path = _make_cycle_config(tmpdir, cycles=1, seed=123)
@@ -174,6 +228,10 @@ class TestCycleDeterminism(unittest.TestCase):
             out2 = os.path.join(tmpdir, "run2")
 
             r1 = run_cycle(config_path=config_path, output_dir=out1)
+            # Clear the cardgen memos so run 2 recomputes candidates and
+            # baselines instead of deep-copying run 1's entries
+            generate_candidates.cache_clear()
+            _baseline_for.cache_clear()
             r2 = run_cycle(config_path=config_path, output_dir=out2)
 
             # Compare key fields (exclude timing)
@@ -195,19 +253,15 @@ class TestCycleGateFail(unittest.TestCase):
     """When gate fails, pool remains unchanged (hash matches)."""
 
     def test_pool_unchanged_on_gate_fail(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = _make_cycle_config(tmpdir, cycles=1, seed=42)
-            output_dir = os.path.join(tmpdir, "out")
-
-            result = run_cycle(config_path=config_path, output_dir=output_dir)
+        result, output_dir = _shared_cycle_run()
 
-            pools_dir = Path(output_dir) / "pools"
-            pool_000 = pools_dir / "pool_000.json"
-            pool_001 = pools_dir / "pool_001.json"
+        pool_001 = Path(output_dir) / "pools" / "pool_001.json"
 
-            # If gate failed, pool_000 and pool_001 must have same hash
-            if not result["cycles"][0]["gate_passed"]:
-                self.assertEqual(_pool_hash(pool_000), _pool_hash(pool_001))
+        # If gate failed, the pool must be unchanged: compare the hashes
+        # run_cycle already computed, and check the snapshot against them
+        if not result["cycles"][0]["gate_passed"]:
+            self.assertEqual(result["initial_pool_hash"], result["final_pool_hash"])
+            self.assertEqual(_pool_hash(pool_001), result["final_pool_hash"])
 
 
 class TestCycleOverrides(unittest.TestCase):
@@ -245,94 +299,104 @@ class TestCycleOverrides(unittest.TestCase):
 class TestCaptureReplays(unittest.TestCase):
     """Test that _capture_replays produces cross-matchup (not mirror) replays."""
 
-    def _setup_replay_dir(self, tmpdir: str, delta: dict) -> tuple[Path, list[str]]:
-        """Create a minimal cycle dir with a promotion_report containing the given delta."""
-        cycle_dir = Path(tmpdir) / "cycle_000"
+    @classmethod
+    def setUpClass(cls):
+        # One temp tree for the class; each test works in its own subdirectory
+        cls._tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def _setup_replay_dir(self, name: str, delta: dict) -> tuple[Path, list[str], dict]:
+        """Create a minimal cycle dir with a promotion_report containing the given delta.
+
+        Returns (cycle_dir, target_paths, promo_report).
+        """
+        cycle_dir = Path(self._tmpdir) / self._testMethodName / name / "cycle_000"
         promo_dir = cycle_dir / "promote"
         promo_dir.mkdir(parents=True)
+        # fixed/adapted "after" blocks are identical; build once, serialize twice
+        after = {
+            "win_rates_by_target": {k: 0.5 + v for k, v in delta.items()},
+            "overall_win_rate": 0.5,
+            "telemetry_aggregate": {},
+        }
         promo_report = {
             "before": {"fixed": {
-                "win_rates_by_target": {k: 0.5 for k in delta},
-                "overall_win_rate": 0.5,
-                "telemetry_aggregate": {},
-            }},
-            "after": {"fixed": {
-                "win_rates_by_target": {k: 0.5 + v for k, v in delta.items()},
-                "overall_win_rate": 0.5,
-                "telemetry_aggregate": {},
-            }, "adapted": {
-                "win_rates_by_target": {k: 0.5 + v for k, v in delta.items()},
+                "win_rates_by_target": dict.fromkeys(delta, 0.5),
                 "overall_win_rate": 0.5,
                 "telemetry_aggregate": {},
             }},
+            "after": {"fixed": after, "adapted": after},
             "delta": {"fixed": delta, "adapted": delta},
             "gate": {"passed": True, "checks": {}, "reason": "ok"},
         }
-        with open(promo_dir / "promotion_report.json", "w") as f:
-            json.dump(promo_report, f)
-        return cycle_dir, TARGET_PATHS
+        (promo_dir / "promotion_report.json").write_text(
+            json.dumps(promo_report), encoding="utf-8",
+        )
+        return cycle_dir, TARGET_PATHS, promo_report
 
     def test_replays_are_cross_matchups(self):
         """With multiple targets, replays should not be mirror matches."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            delta = {
-                "aggro_rush": 0.05,
-                "control_mage": -0.03,
-                "midrange": 0.01,
-            }
-            cycle_dir, target_paths = self._setup_replay_dir(tmpdir, delta)
-            replay_config = {"top_k_matchups": 3}
-
-            paths = _capture_replays(
-                cycle_dir, Path(CARDS_JSON), target_paths,
-                cycle_seed=42, replay_config=replay_config,
-            )
-            self.assertGreater(len(paths), 0)
-
-            # Read each replay and check deck_ids are different
-            for rp in paths:
-                with open(rp, encoding="utf-8") as f:
-                    for line in f:
-                        ev = json.loads(line)
-                        if ev.get("type") == "meta":
-                            deck_ids = ev.get("deck_ids", [])
-                            if len(deck_ids) == 2:
-                                # With 3 targets, at least some should be cross
-                                # (all are cross with circular pairing)
-                                self.assertNotEqual(
-                                    deck_ids[0], deck_ids[1],
-                                    f"Mirror match found: {deck_ids}",
-                                )
-                            break
+        delta = {
+            "aggro_rush": 0.05,
+            "control_mage": -0.03,
+            "midrange": 0.01,
+        }
+        cycle_dir, target_paths, report = self._setup_replay_dir("run", delta)
+        replay_config = {"top_k_matchups": 3}
+
+        paths = _capture_replays(
+            cycle_dir, Path(CARDS_JSON), target_paths,
+            cycle_seed=42, replay_config=replay_config, promo_report=report,
+        )
+        self.assertGreater(len(paths), 0)
+
+        # Read each replay and check deck_ids are different
+        for rp in paths:
+            with open(rp, "rb") as f:
+                for raw in f:
+                    # Cheap substring test before parsing the line
+                    if b'"meta"' not in raw:
+                        continue
+                    ev = json.loads(raw)
+                    if ev.get("type") == "meta":
+                        deck_ids = ev.get("deck_ids", [])
+                        if len(deck_ids) == 2:
+                            # With 3 targets, at least some should be cross
+                            # (all are cross with circular pairing)
+                            self.assertNotEqual(
+                                deck_ids[0], deck_ids[1],
+                                f"Mirror match found: {deck_ids}",
+                            )
+                        break
 
     def test_replay_seed_determinism(self):
         """Same cycle_seed should produce identical replays."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            delta = {"aggro_rush": 0.05, "control_mage": -0.03}
-
-            # Run 1
-            cycle_dir1, target_paths = self._setup_replay_dir(
-                os.path.join(tmpdir, "r1"), delta,
-            )
-            paths1 = _capture_replays(
-                cycle_dir1, Path(CARDS_JSON), target_paths,
-                cycle_seed=42, replay_config={"top_k_matchups": 2},
-            )
-
-            # Run 2
-            cycle_dir2, _ = self._setup_replay_dir(
-                os.path.join(tmpdir, "r2"), delta,
-            )
-            paths2 = _capture_replays(
-                cycle_dir2, Path(CARDS_JSON), target_paths,
-                cycle_seed=42, replay_config={"top_k_matchups": 2},
+        delta = {"aggro_rush": 0.05, "control_mage": -0.03}
+
+        # Run 1
+        cycle_dir1, target_paths, report1 = self._setup_replay_dir("r1", delta)
+        paths1 = _capture_replays(
+            cycle_dir1, Path(CARDS_JSON), target_paths,
+            cycle_seed=42, replay_config={"top_k_matchups": 2}, promo_report=report1,
+        )
+
+        # Run 2 reads the report from disk, as run_cycle does
+        cycle_dir2, _, _ = self._setup_replay_dir("r2", delta)
+        paths2 = _capture_replays(
+            cycle_dir2, Path(CARDS_JSON), target_paths,
+            cycle_seed=42, replay_config={"top_k_matchups": 2},
+        )
+
+        self.assertEqual(len(paths1), len(paths2))
+        for p1, p2 in zip(paths1, paths2):
+            self.assertTrue(
+                filecmp.cmp(p1, p2, shallow=False),
+                f"Replay files differ: {p1} vs {p2}",
             )
 
-            self.assertEqual(len(paths1), len(paths2))
-            for p1, p2 in zip(paths1, paths2):
-                with open(p1) as f1, open(p2) as f2:
-                    self.assertEqual(f1.read(), f2.read())
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 
 import os
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
 from card_battle.ai import GreedyAI
 from card_battle.engine import init_game, run_game
@@ -12,23 +13,37 @@ DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 
 
+def _run_once(card_db, deck_a, deck_b, seed):
+    """Play one traced GreedyAI game; module-level so worker processes can run it."""
+    gs = init_game(card_db, deck_a, deck_b, seed)
+    agents = (GreedyAI(), GreedyAI())
+    log = run_game(gs, agents, trace=True)
+    return (
+        log.winner,
+        log.turns,
+        log.final_hp,
+        len(log.play_trace),
+    )
+
+
 class TestDeterminism(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Read-only inputs shared by every test: parse cards and decks once
+        cls.card_db = load_cards(CARDS_JSON)
+        cls.deck_a = load_deck(os.path.join(DATA_DIR, "decks", "aggro_rush.json"), cls.card_db)
+        cls.deck_b = load_deck(os.path.join(DATA_DIR, "decks", "control_mage.json"), cls.card_db)
+
     def test_same_seed_same_result_10_runs(self):
-        card_db = load_cards(CARDS_JSON)
-        deck_a = load_deck(os.path.join(DATA_DIR, "decks", "aggro_rush.json"), card_db)
-        deck_b = load_deck(os.path.join(DATA_DIR, "decks", "control_mage.json"), card_db)
+        card_db, deck_a, deck_b = self.card_db, self.deck_a, self.deck_b
         seed = 12345
 
-        results = []
-        for _ in range(10):
-            gs = init_game(card_db, deck_a, deck_b, seed)
-            agents = (GreedyAI(), GreedyAI())
-            log = run_game(gs, agents, trace=True)
-            results.append((
-                log.winner,
-                log.turns,
-                log.final_hp,
-                len(log.play_trace),
+        # Runs are independent, so spread them across worker processes
+        n_runs = 10
+        with ProcessPoolExecutor(max_workers=min(n_runs, os.cpu_count() or 1)) as ex:
+            results = list(ex.map(
+                _run_once,
+                [card_db] * n_runs, [deck_a] * n_runs, [deck_b] * n_runs, [seed] * n_runs,
             ))
 
         # All 10 runs must produce identical results
@@ -38,9 +53,7 @@ class TestDeterminism(unittest.TestCase):
 
     def test_different_seeds_different_results(self):
         """Different seeds should (very likely) produce different games."""
-        card_db = load_cards(CARDS_JSON)
-        deck_a = load_deck(os.path.join(DATA_DIR, "decks", "aggro_rush.json"), card_db)
-        deck_b = load_deck(os.path.join(DATA_DIR, "decks", "control_mage.json"), card_db)
+        card_db, deck_a, deck_b = self.card_db, self.deck_a, self.deck_b
 
         results = set()
         for seed in range(10):
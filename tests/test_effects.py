@@ -7,10 +7,16 @@ from card_battle.effects import EFFECT_REGISTRY, resolve_effect, _draw_one
 from card_battle.models import Card, GameState, PlayerState, UnitInstance
 
 
+# Canonical default decks; _make_gs hands each PlayerState its own list copy
+# since draws pop from the deck.
+_DECK_A = ("a", "b", "c")
+_DECK_B = ("d", "e", "f")
+
+
 def _make_gs(**kwargs) -> GameState:
     defaults = dict(
         turn=1, active_player=0,
-        players=[PlayerState(deck=["a", "b", "c"]), PlayerState(deck=["d", "e", "f"])],
+        players=[PlayerState(deck=list(_DECK_A)), PlayerState(deck=list(_DECK_B))],
         next_uid=1, result=None,
         rng=random.Random(42), card_db={},
     )
@@ -74,13 +80,23 @@ class TestDraw(unittest.TestCase):
         self.assertEqual(gs.players[0].deck, ["c"])
 
 
+# (uid, card_id, atk, hp) for the RemoveUnit board fixtures
+_BIG_UNIT = (1, "big", 5, 5)
+_SMALL_UNIT = (2, "small", 2, 3)
+
+
+def _board(*specs: tuple) -> list[UnitInstance]:
+    """Fresh UnitInstances from the shared (uid, card_id, atk, hp) specs."""
+    return [
+        UnitInstance(uid=uid, card_id=card_id, atk=atk, hp=hp)
+        for uid, card_id, atk, hp in specs
+    ]
+
+
 class TestRemoveUnit(unittest.TestCase):
     def test_remove_eligible(self):
         gs = _make_gs()
-        gs.players[1].board = [
-            UnitInstance(uid=1, card_id="big", atk=5, hp=5),
-            UnitInstance(uid=2, card_id="small", atk=2, hp=3),
-        ]
+        gs.players[1].board = _board(_BIG_UNIT, _SMALL_UNIT)
         resolve_effect(gs, 0, "RemoveUnit", {"max_hp": 4})
         self.assertEqual(len(gs.players[1].board), 1)
         self.assertEqual(gs.players[1].board[0].card_id, "big")
@@ -88,9 +104,7 @@ class TestRemoveUnit(unittest.TestCase):
 
     def test_remove_none_eligible(self):
         gs = _make_gs()
-        gs.players[1].board = [
-            UnitInstance(uid=1, card_id="big", atk=5, hp=5),
-        ]
+        gs.players[1].board = _board(_BIG_UNIT)
         resolve_effect(gs, 0, "RemoveUnit", {"max_hp": 4})
         self.assertEqual(len(gs.players[1].board), 1)
 
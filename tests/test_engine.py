@@ -5,33 +5,32 @@ import unittest
 
 from card_battle.ai import GreedyAI
 from card_battle.engine import init_game, run_game, _resolve_combat, MAX_TURNS
-from card_battle.loader import load_cards, load_deck
 from card_battle.models import (
-    CombatState, GameResult, GameState, PlayerState, UnitInstance,
+    Card, CombatState, GameResult, GameState, PlayerState, UnitInstance,
 )
 import random
 
+from tests._fixtures import cached_card_db, cached_deck
+
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 
 
-def _card_db():
-    return {
-        "soldier": __import__("card_battle.models", fromlist=["Card"]).Card(
-            id="soldier", name="Soldier", cost=2, card_type="unit",
-            tags=(), template="Vanilla", params={"atk": 2, "hp": 2},
-        ),
-        "knight": __import__("card_battle.models", fromlist=["Card"]).Card(
-            id="knight", name="Knight", cost=3, card_type="unit",
-            tags=(), template="Vanilla", params={"atk": 3, "hp": 4},
-        ),
-    }
+# Shared two-card DB for hand-built states; Card is frozen and tests never write to it
+_CARD_DB = {
+    "soldier": Card(
+        id="soldier", name="Soldier", cost=2, card_type="unit",
+        tags=(), template="Vanilla", params={"atk": 2, "hp": 2},
+    ),
+    "knight": Card(
+        id="knight", name="Knight", cost=3, card_type="unit",
+        tags=(), template="Vanilla", params={"atk": 3, "hp": 4},
+    ),
+}
 
 
 def _make_gs(**kwargs):
-    from card_battle.models import Card
-    db = _card_db()
     defaults = dict(
         turn=1, active_player=0,
         players=[
@@ -39,17 +38,18 @@ def _make_gs(**kwargs):
             PlayerState(deck=["soldier"] * 10),
         ],
         next_uid=100, result=None,
-        rng=random.Random(42), card_db=db,
+        rng=random.Random(42), card_db=_CARD_DB,
     )
     defaults.update(kwargs)
     return GameState(**defaults)
 
 
 class TestInitGame(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck_a = load_deck(os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db)
-        self.deck_b = load_deck(os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db)
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck_a = cached_deck("aggro_rush")
+        cls.deck_b = cached_deck("control_mage")
 
     def test_initial_state(self):
         gs = init_game(self.card_db, self.deck_a, self.deck_b, seed=42)
@@ -72,10 +72,11 @@ class TestInitGame(unittest.TestCase):
 
 
 class TestRunGame(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck_a = load_deck(os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db)
-        self.deck_b = load_deck(os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db)
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck_a = cached_deck("aggro_rush")
+        cls.deck_b = cached_deck("control_mage")
 
     def test_game_completes(self):
         gs = init_game(self.card_db, self.deck_a, self.deck_b, seed=42)
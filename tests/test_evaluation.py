@@ -8,7 +8,8 @@ from card_battle.evaluation import (
     evaluate_deck_vs_pool,
     evaluate_population,
 )
-from card_battle.loader import load_cards, load_deck
+
+from tests._fixtures import cached_card_db, cached_deck
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
@@ -42,17 +43,12 @@ class TestDeriveMatchSeed(unittest.TestCase):
 
 
 class TestEvaluateDeckVsPool(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.aggro = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
-        )
-        self.control = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db
-        )
-        self.midrange = load_deck(
-            os.path.join(DATA_DIR, "decks", "midrange.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.aggro = cached_deck("aggro_rush")
+        cls.control = cached_deck("control_mage")
+        cls.midrange = cached_deck("midrange")
 
     def test_fitness_range(self):
         fitness = evaluate_deck_vs_pool(
@@ -77,11 +73,12 @@ class TestEvaluateDeckVsPool(unittest.TestCase):
 
 
 class TestEvaluatePopulation(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.decks = [
-            load_deck(os.path.join(DATA_DIR, "decks", f), self.card_db)
-            for f in ("aggro_rush.json", "control_mage.json", "midrange.json")
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.decks = [
+            cached_deck(name)
+            for name in ("aggro_rush", "control_mage", "midrange")
         ]
 
     def test_returns_all(self):
@@ -93,6 +90,17 @@ class TestEvaluatePopulation(unittest.TestCase):
             self.assertGreaterEqual(fitness, 0.0)
             self.assertLessEqual(fitness, 1.0)
 
+    def test_workers_match_sequential(self):
+        seq = evaluate_population(
+            self.decks, self.decks[:2], self.card_db, 42, 0, 1,
+            collect_telemetry=True,
+        )
+        par = evaluate_population(
+            self.decks, self.decks[:2], self.card_db, 42, 0, 1,
+            collect_telemetry=True, workers=2,
+        )
+        self.assertEqual(par, seq)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 """Tests for v0.3: Evolution runner integration tests."""
 
+import functools
 import json
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -40,25 +42,40 @@ def _small_config(output_dir: str, **overrides) -> EvolutionConfig:
     return EvolutionConfig(**defaults)
 
 
+_SHARED_EVOLVE_TMPDIRS: list[str] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_evolve_run() -> tuple[EvolutionConfig, str]:
+    """Run the default _small_config once per module; returns (config, output_dir)."""
+    tmpdir = tempfile.mkdtemp()
+    _SHARED_EVOLVE_TMPDIRS.append(tmpdir)
+    config = _small_config(tmpdir)
+    EvolutionRunner(config).run()
+    return config, tmpdir
+
+
+def tearDownModule():
+    for tmpdir in _SHARED_EVOLVE_TMPDIRS:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
 class TestEvolutionSmoke(unittest.TestCase):
     def test_two_generations(self):
         """Run 2 generations with small population, no crash."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = _small_config(tmpdir)
-            runner = EvolutionRunner(config)
-            runner.run()
+        _, tmpdir = _shared_evolve_run()
 
-            # Check artifacts exist
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "config_used.json")))
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "best_decks.json")))
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_000", "population.json")))
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_000", "summary.json")))
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_001", "population.json")))
+        # Check artifacts exist
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "config_used.json")))
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "best_decks.json")))
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_000", "population.json")))
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_000", "summary.json")))
+        self.assertTrue(os.path.exists(os.path.join(tmpdir, "gen_001", "population.json")))
 
-            # best_decks.json should have 2 entries (one per generation)
-            with open(os.path.join(tmpdir, "best_decks.json")) as f:
-                best = json.load(f)
-            self.assertEqual(len(best), 2)
+        # best_decks.json should have 2 entries (one per generation)
+        with open(os.path.join(tmpdir, "best_decks.json")) as f:
+            best = json.load(f)
+        self.assertEqual(len(best), 2)
 
     def test_random_init(self):
         """Run with random initial population."""
@@ -77,17 +94,19 @@ class TestEvolutionSmoke(unittest.TestCase):
 class TestEvolutionDeterminism(unittest.TestCase):
     def test_same_config_same_result(self):
         """Two runs with identical config produce identical best_decks.json."""
-        results = []
-        for _ in range(2):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                config = _small_config(tmpdir)
-                runner = EvolutionRunner(config)
-                runner.run()
+        _, shared_dir = _shared_evolve_run()
+        with open(os.path.join(shared_dir, "best_decks.json")) as f:
+            shared = json.load(f)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _small_config(tmpdir)
+            runner = EvolutionRunner(config)
+            runner.run()
 
-                with open(os.path.join(tmpdir, "best_decks.json")) as f:
-                    results.append(json.load(f))
+            with open(os.path.join(tmpdir, "best_decks.json")) as f:
+                fresh = json.load(f)
 
-        self.assertEqual(results[0], results[1])
+        self.assertEqual(shared, fresh)
 
 
 class TestEvolutionConfig(unittest.TestCase):
@@ -108,38 +127,32 @@ class TestEvolutionConfig(unittest.TestCase):
 class TestEvolutionArtifacts(unittest.TestCase):
     def test_population_json_structure(self):
         """Verify population.json has expected fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = _small_config(tmpdir)
-            runner = EvolutionRunner(config)
-            runner.run()
+        config, tmpdir = _shared_evolve_run()
 
-            with open(os.path.join(tmpdir, "gen_000", "population.json")) as f:
-                pop = json.load(f)
+        with open(os.path.join(tmpdir, "gen_000", "population.json")) as f:
+            pop = json.load(f)
 
-            self.assertEqual(len(pop), config.population_size)
-            for entry in pop:
-                self.assertIn("deck_id", entry)
-                self.assertIn("fitness", entry)
-                self.assertIn("entries", entry)
-                self.assertGreaterEqual(entry["fitness"], 0.0)
-                self.assertLessEqual(entry["fitness"], 1.0)
+        self.assertEqual(len(pop), config.population_size)
+        for entry in pop:
+            self.assertIn("deck_id", entry)
+            self.assertIn("fitness", entry)
+            self.assertIn("entries", entry)
+            self.assertGreaterEqual(entry["fitness"], 0.0)
+            self.assertLessEqual(entry["fitness"], 1.0)
 
     def test_summary_json_structure(self):
         """Verify summary.json has expected fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = _small_config(tmpdir)
-            runner = EvolutionRunner(config)
-            runner.run()
+        config, tmpdir = _shared_evolve_run()
 
-            with open(os.path.join(tmpdir, "gen_000", "summary.json")) as f:
-                summary = json.load(f)
+        with open(os.path.join(tmpdir, "gen_000", "summary.json")) as f:
+            summary = json.load(f)
 
-            self.assertIn("generation", summary)
-            self.assertIn("stats", summary)
-            self.assertIn("top_decks", summary)
-            self.assertIn("mean", summary["stats"])
-            self.assertIn("max", summary["stats"])
-            self.assertLessEqual(len(summary["top_decks"]), config.top_n_summary)
+        self.assertIn("generation", summary)
+        self.assertIn("stats", summary)
+        self.assertIn("top_decks", summary)
+        self.assertIn("mean", summary["stats"])
+        self.assertIn("max", summary["stats"])
+        self.assertLessEqual(len(summary["top_decks"]), config.top_n_summary)
 
 
 if __name__ == "__main__":
@@ -102,6 +102,28 @@ class TestLoadDeck(unittest.TestCase):
                 load_deck(f.name, self.card_db)
         os.unlink(f.name)
 
+    def test_rewrite_invalidates_cache(self):
+        path = os.path.join(DATA_DIR, "decks", "aggro_rush.json")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            deck_path = os.path.join(tmpdir, "deck.json")
+            with open(deck_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertEqual(load_deck(deck_path, self.card_db).deck_id, "aggro_rush")
+            data["deck_id"] = "renamed_deck"
+            with open(deck_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertEqual(load_deck(deck_path, self.card_db).deck_id, "renamed_deck")
+
+    def test_cached_deck_revalidated_per_card_db(self):
+        path = os.path.join(DATA_DIR, "decks", "aggro_rush.json")
+        deck = load_deck(path, self.card_db)
+        missing = deck.entries[0].card_id
+        smaller_db = {k: v for k, v in self.card_db.items() if k != missing}
+        with self.assertRaises(ValueError):
+            load_deck(path, smaller_db)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for Phase 1: Data models."""
 
+import copy
 import random
 import unittest
 
@@ -25,6 +26,21 @@ class TestCard(unittest.TestCase):
         self.assertFalse(spell.is_unit)
 
 
+class TestUnitInstance(unittest.TestCase):
+    def test_slots(self):
+        u = UnitInstance(uid=1, card_id="x", atk=1, hp=1)
+        with self.assertRaises(AttributeError):
+            u.extra = 1  # type: ignore[attr-defined]
+
+    def test_deepcopy_independent(self):
+        u = UnitInstance(uid=1, card_id="x", atk=2, hp=3, can_attack=True)
+        c = copy.deepcopy(u)
+        self.assertEqual(c, u)
+        self.assertIsNot(c, u)
+        c.hp -= 1
+        self.assertEqual(u.hp, 3)
+
+
 class TestPlayerState(unittest.TestCase):
     def test_defaults(self):
         p = PlayerState()
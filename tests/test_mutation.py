@@ -4,7 +4,6 @@ import os
 import random
 import unittest
 
-from card_battle.loader import load_cards, load_deck
 from card_battle.mutation import (
     DECK_SIZE,
     MAX_COPIES,
@@ -18,30 +17,28 @@ from card_battle.mutation import (
     validate_counts,
 )
 
+from tests._fixtures import cached_card_db, cached_deck
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 
 
 class TestDeckCountsConversion(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck = cached_deck("aggro_rush")
 
     def test_round_trip(self):
         """deck_to_counts -> counts_to_deck produces equivalent deck."""
         counts = deck_to_counts(self.deck)
         rebuilt = counts_to_deck(self.deck.deck_id, counts)
-        # Same total cards
-        self.assertEqual(
-            sum(e.count for e in rebuilt.entries),
-            sum(e.count for e in self.deck.entries),
-        )
-        # Same card counts (order may differ since counts_to_deck sorts)
+        # Same card counts (order may differ since counts_to_deck sorts);
+        # equal maps imply equal totals. The expected map is built from the
+        # entries directly so it does not depend on deck_to_counts.
         original = {e.card_id: e.count for e in self.deck.entries}
-        rebuilt_map = {e.card_id: e.count for e in rebuilt.entries}
-        self.assertEqual(original, rebuilt_map)
+        self.assertEqual(counts, original)
+        self.assertEqual(deck_to_counts(rebuilt), original)
 
     def test_validate_counts_valid(self):
         counts = deck_to_counts(self.deck)
@@ -66,87 +63,80 @@ class TestDeckCountsConversion(unittest.TestCase):
 
 
 class TestSwapOne(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck = cached_deck("aggro_rush")
+        # Operators copy their input, so one counts map serves every test
+        cls.counts = deck_to_counts(cls.deck)
 
     def test_preserves_constraints(self):
         """swap_one always produces valid 30-card deck with counts in [1,3]."""
         rng = random.Random(42)
-        counts = deck_to_counts(self.deck)
-        for _ in range(100):
-            result = swap_one(counts, self.card_db, rng)
-            self.assertTrue(validate_counts(result),
-                            f"Invalid counts: {result}")
+        results = [swap_one(self.counts, self.card_db, rng) for _ in range(100)]
+        bad = [r for r in results if not validate_counts(r)]
+        self.assertFalse(bad, f"{len(bad)} invalid: {bad[:3]}")
 
     def test_deterministic(self):
         """Same seed produces same result."""
-        counts = deck_to_counts(self.deck)
-        r1 = swap_one(counts, self.card_db, random.Random(99))
-        r2 = swap_one(counts, self.card_db, random.Random(99))
+        r1 = swap_one(self.counts, self.card_db, random.Random(99))
+        r2 = swap_one(self.counts, self.card_db, random.Random(99))
         self.assertEqual(r1, r2)
 
 
 class TestSwapN(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "midrange.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck = cached_deck("midrange")
+        cls.counts = deck_to_counts(cls.deck)
 
     def test_preserves_constraints(self):
         rng = random.Random(7)
-        counts = deck_to_counts(self.deck)
-        for _ in range(50):
-            result = swap_n(counts, self.card_db, rng, (2, 5))
-            self.assertTrue(validate_counts(result))
+        results = [swap_n(self.counts, self.card_db, rng, (2, 5)) for _ in range(50)]
+        bad = [r for r in results if not validate_counts(r)]
+        self.assertFalse(bad, f"{len(bad)} invalid: {bad[:3]}")
 
 
 class TestTweakCounts(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck = cached_deck("control_mage")
+        cls.counts = deck_to_counts(cls.deck)
 
     def test_preserves_constraints(self):
         rng = random.Random(123)
-        counts = deck_to_counts(self.deck)
-        for _ in range(100):
-            result = tweak_counts(counts, self.card_db, rng)
-            self.assertTrue(validate_counts(result),
-                            f"Invalid counts: {result}")
+        results = [tweak_counts(self.counts, self.card_db, rng) for _ in range(100)]
+        bad = [r for r in results if not validate_counts(r)]
+        self.assertFalse(bad, f"{len(bad)} invalid: {bad[:3]}")
 
     def test_can_add_new_card(self):
         """tweak_counts can introduce a card not in the original deck."""
         rng = random.Random(0)
-        counts = deck_to_counts(self.deck)
-        original_cards = set(counts.keys())
-        found_new = False
-        for _ in range(200):
-            result = tweak_counts(counts, self.card_db, rng)
-            if set(result.keys()) != original_cards:
-                found_new = True
-                break
+        original_cards = self.counts.keys()
+        found_new = any(
+            tweak_counts(self.counts, self.card_db, rng).keys() != original_cards
+            for _ in range(200)
+        )
         self.assertTrue(found_new, "tweak_counts never introduced a new card")
 
 
 class TestMutateDeck(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.deck = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
-        )
-        self.weights = {"swap_one": 0.5, "swap_n": 0.3, "tweak_counts": 0.2}
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.deck = cached_deck("aggro_rush")
+        cls.weights = {"swap_one": 0.5, "swap_n": 0.3, "tweak_counts": 0.2}
 
     def test_preserves_constraints(self):
         rng = random.Random(42)
-        for _ in range(50):
-            result = mutate_deck(self.deck, self.card_db, rng, self.weights)
-            counts = deck_to_counts(result)
-            self.assertTrue(validate_counts(counts))
+        results = [
+            deck_to_counts(mutate_deck(self.deck, self.card_db, rng, self.weights))
+            for _ in range(50)
+        ]
+        bad = [r for r in results if not validate_counts(r)]
+        self.assertFalse(bad, f"{len(bad)} invalid: {bad[:3]}")
 
     def test_deterministic(self):
         d1 = mutate_deck(self.deck, self.card_db, random.Random(42), self.weights)
@@ -159,15 +149,18 @@ class TestMutateDeck(unittest.TestCase):
 
 
 class TestRandomDeck(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
 
     def test_valid(self):
         rng = random.Random(42)
-        for i in range(20):
-            deck = random_deck(f"rnd_{i}", self.card_db, rng)
-            counts = deck_to_counts(deck)
-            self.assertTrue(validate_counts(counts))
+        results = [
+            deck_to_counts(random_deck(f"rnd_{i}", self.card_db, rng))
+            for i in range(20)
+        ]
+        bad = [r for r in results if not validate_counts(r)]
+        self.assertFalse(bad, f"{len(bad)} invalid: {bad[:3]}")
 
     def test_deterministic(self):
         d1 = random_deck("a", self.card_db, random.Random(42))
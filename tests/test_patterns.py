@@ -1,13 +1,16 @@
 """Tests for v0.4: Tactical pattern extraction."""
 
+import functools
 import json
 import os
+import shutil
 import tempfile
 import unittest
 import warnings
 
 from card_battle.patterns import (
     _pattern_id,
+    _serialize_patterns,
     extract_all_patterns,
     extract_cooccurrence,
     extract_counters,
@@ -18,6 +21,8 @@ from card_battle.patterns import (
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
+_DECK_NAMES = ("aggro_rush", "control_mage", "midrange")
+_DECK_PATHS = {n: os.path.join(DATA_DIR, "decks", f"{n}.json") for n in _DECK_NAMES}
 CONFIG_JSON = os.path.join(os.path.dirname(__file__), "..", "configs", "evolve_v0_3.json")
 PATTERNS_CONFIG = os.path.join(
     os.path.dirname(__file__), "..", "configs", "patterns_v0_4.json",
@@ -110,14 +115,12 @@ class TestWritePatterns(unittest.TestCase):
                 "examples": {"match_ids": []},
             },
         ]
-        with tempfile.NamedTemporaryFile(
-            suffix=".json", delete=False,
-        ) as f:
-            path = f.name
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
         try:
             write_patterns(patterns, path, {"version": "0.4"})
-            with open(path) as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json.loads(f.read())
             self.assertIn("meta", data)
             self.assertIn("patterns", data)
             self.assertEqual(data["meta"]["version"], "0.4")
@@ -142,17 +145,10 @@ class TestWritePatterns(unittest.TestCase):
             "stats": {"support": 3, "win_rate": 0.8, "lift": 2.0, "avg_turns": 0.0},
             "examples": {"match_ids": []},
         }
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
-        try:
-            write_patterns([p1, p2], path, {"version": "0.4"})
-            with open(path) as f:
-                data = json.load(f)
-            # p2 (lift=2.0) should come first
-            self.assertEqual(data["patterns"][0]["pattern_id"], "bbb")
-            self.assertEqual(data["patterns"][1]["pattern_id"], "aaa")
-        finally:
-            os.unlink(path)
+        data = _serialize_patterns([p1, p2], {"version": "0.4"})
+        # p2 (lift=2.0) should come first
+        self.assertEqual(data["patterns"][0]["pattern_id"], "bbb")
+        self.assertEqual(data["patterns"][1]["pattern_id"], "aaa")
 
 
 class TestExtractCooccurrence(unittest.TestCase):
@@ -313,144 +309,139 @@ class TestDeterminism(unittest.TestCase):
             "top_n_decks": 10,
         }
 
-        results = []
-        for _ in range(2):
-            all_patterns = []
-            all_patterns.extend(extract_cooccurrence(decks, config, summaries))
-            all_patterns.extend(extract_sequences(summaries, config))
-            all_patterns.extend(extract_counters(summaries, decks, config))
-
-            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-                path = f.name
-            try:
-                write_patterns(all_patterns, path, {"version": "0.4"})
-                with open(path) as f:
-                    results.append(json.load(f))
-            finally:
-                os.unlink(path)
-
-        self.assertEqual(results[0], results[1])
+        runs = [
+            extract_cooccurrence(decks, config, summaries)
+            + extract_sequences(summaries, config)
+            + extract_counters(summaries, decks, config)
+            for _ in range(2)
+        ]
+        # Extractor output itself is deterministic, including its order
+        self.assertEqual(runs[0], runs[1])
+
+        # ...and so is the encoded patterns.json document, byte for byte
+        encoded = [
+            json.dumps(_serialize_patterns(r, {"version": "0.4"}),
+                       indent=2, ensure_ascii=False)
+            for r in runs
+        ]
+        self.assertEqual(encoded[0], encoded[1])
+
+
+_SHARED_EVOLVE_TMPDIRS: list[str] = []
+
+
+def _telemetry_evolve_config(output_dir: str, save_turn_trace: bool):
+    """Small 2-generation evolve config with match summaries enabled."""
+    from card_battle.evolve import EvolutionConfig
+
+    return EvolutionConfig(
+        global_seed=42,
+        generations=2,
+        population_size=6,
+        matches_per_eval=1,
+        elite_pool_size=3,
+        elitism=2,
+        tournament_k=3,
+        cards_path=CARDS_JSON,
+        seed_decks=[
+            _DECK_PATHS["aggro_rush"],
+            _DECK_PATHS["control_mage"],
+            _DECK_PATHS["midrange"],
+        ],
+        initial_population="seed_decks",
+        output_dir=output_dir,
+        log_every_n=1,
+        top_n_summary=3,
+        telemetry={
+            "enabled": True,
+            "save_match_summaries": True,
+            "save_turn_trace": save_turn_trace,
+        },
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_evolve_run(save_turn_trace: bool) -> str:
+    """Run the telemetry evolve config once per module; returns its artifact dir."""
+    from card_battle.evolve import EvolutionRunner
+
+    tmpdir = tempfile.mkdtemp()
+    _SHARED_EVOLVE_TMPDIRS.append(tmpdir)
+    EvolutionRunner(_telemetry_evolve_config(tmpdir, save_turn_trace)).run()
+    return tmpdir
+
+
+def tearDownModule():
+    for tmpdir in _SHARED_EVOLVE_TMPDIRS:
+        shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 class TestEndToEndPipeline(unittest.TestCase):
     """Integration test: evolve → patterns extraction."""
 
     def test_evolve_then_patterns(self):
-        from card_battle.evolve import EvolutionConfig, EvolutionRunner
+        artifact_dir = _shared_evolve_run(save_turn_trace=True)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Run a small evolution with summaries + turn_trace
-            config = EvolutionConfig(
-                global_seed=42,
-                generations=3,
-                population_size=6,
-                matches_per_eval=1,
-                elite_pool_size=3,
-                elitism=2,
-                tournament_k=3,
-                mutation_weights={"swap_one": 0.5, "swap_n": 0.3, "tweak_counts": 0.2},
-                swap_n_range=(2, 3),
-                cards_path=CARDS_JSON,
-                seed_decks=[
-                    os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                    os.path.join(DATA_DIR, "decks", "control_mage.json"),
-                    os.path.join(DATA_DIR, "decks", "midrange.json"),
-                ],
-                initial_population="seed_decks",
-                output_dir=tmpdir,
-                log_every_n=1,
-                top_n_summary=3,
-                telemetry={
-                    "enabled": True,
-                    "save_match_summaries": True,
-                    "save_turn_trace": True,
-                },
-            )
-            runner = EvolutionRunner(config)
-            runner.run()
+        # Verify JSONL files were created
+        jsonl_files = list(
+            p for p in os.listdir(artifact_dir)
+            if p.endswith("_summaries.jsonl")
+        )
+        self.assertGreater(len(jsonl_files), 0)
 
-            # Verify JSONL files were created
-            jsonl_files = list(
-                p for p in os.listdir(tmpdir)
-                if p.endswith("_summaries.jsonl")
-            )
-            self.assertGreater(len(jsonl_files), 0)
-
-            # Run pattern extraction
-            pat_config = {
-                "min_support": 2,
-                "max_itemset_size": 3,
-                "sequence": {"turns": 3, "min_support": 2},
-                "counter": {
-                    "targets": ["aggro_rush", "control_mage", "midrange"],
-                    "min_lift": 1.0,
-                },
-                "top_n_decks": 5,
-            }
+        # Run pattern extraction
+        pat_config = {
+            "min_support": 2,
+            "max_itemset_size": 3,
+            "sequence": {"turns": 3, "min_support": 2},
+            "counter": {
+                "targets": ["aggro_rush", "control_mage", "midrange"],
+                "min_lift": 1.0,
+            },
+            "top_n_decks": 5,
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
             output_path = os.path.join(tmpdir, "patterns.json")
             patterns = extract_all_patterns(
-                tmpdir, pat_config, output_path=output_path,
+                artifact_dir, pat_config, output_path=output_path,
             )
 
             # Verify output
             self.assertTrue(os.path.exists(output_path))
             with open(output_path) as f:
                 data = json.load(f)
-            self.assertIn("meta", data)
-            self.assertIn("patterns", data)
-            self.assertEqual(data["meta"]["version"], "0.4")
+        self.assertIn("meta", data)
+        self.assertIn("patterns", data)
+        self.assertEqual(data["meta"]["version"], "0.4")
 
-            # Should have some patterns
-            types = {p["type"] for p in patterns}
-            # At minimum, cooccurrence should be present
-            self.assertIn("cooccurrence", types)
+        # Should have some patterns
+        types = {p["type"] for p in patterns}
+        # At minimum, cooccurrence should be present
+        self.assertIn("cooccurrence", types)
 
     def test_evolve_then_patterns_deterministic(self):
         """Same evolve → same patterns output."""
-        from card_battle.evolve import EvolutionConfig, EvolutionRunner
+        from card_battle.evolve import EvolutionRunner
+
+        pat_config = {
+            "min_support": 2,
+            "max_itemset_size": 2,
+            "sequence": {"turns": 3, "min_support": 2},
+            "counter": {
+                "targets": ["aggro_rush", "control_mage"],
+                "min_lift": 1.0,
+            },
+            "top_n_decks": 5,
+        }
 
         results = []
-        for _ in range(2):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                config = EvolutionConfig(
-                    global_seed=42,
-                    generations=2,
-                    population_size=6,
-                    matches_per_eval=1,
-                    elite_pool_size=3,
-                    elitism=2,
-                    tournament_k=3,
-                    cards_path=CARDS_JSON,
-                    seed_decks=[
-                        os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                        os.path.join(DATA_DIR, "decks", "control_mage.json"),
-                        os.path.join(DATA_DIR, "decks", "midrange.json"),
-                    ],
-                    initial_population="seed_decks",
-                    output_dir=tmpdir,
-                    log_every_n=1,
-                    top_n_summary=3,
-                    telemetry={
-                        "enabled": True,
-                        "save_match_summaries": True,
-                        "save_turn_trace": True,
-                    },
-                )
-                runner = EvolutionRunner(config)
-                runner.run()
-
-                pat_config = {
-                    "min_support": 2,
-                    "max_itemset_size": 2,
-                    "sequence": {"turns": 3, "min_support": 2},
-                    "counter": {
-                        "targets": ["aggro_rush", "control_mage"],
-                        "min_lift": 1.0,
-                    },
-                    "top_n_decks": 5,
-                }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Compare the shared run against an independent fresh run
+            fresh_dir = os.path.join(tmpdir, "fresh")
+            EvolutionRunner(_telemetry_evolve_config(fresh_dir, True)).run()
+            for artifact_dir in (_shared_evolve_run(save_turn_trace=True), fresh_dir):
                 output_path = os.path.join(tmpdir, "patterns.json")
-                extract_all_patterns(tmpdir, pat_config, output_path=output_path)
+                extract_all_patterns(artifact_dir, pat_config, output_path=output_path)
                 with open(output_path) as f:
                     data = json.load(f)
                 results.append(data["patterns"])
@@ -462,51 +453,24 @@ class TestTurnTraceOff(unittest.TestCase):
     """When turn_trace is OFF, sequence extraction skips with warning."""
 
     def test_no_crash_no_sequences(self):
-        from card_battle.evolve import EvolutionConfig, EvolutionRunner
+        artifact_dir = _shared_evolve_run(save_turn_trace=False)
 
+        pat_config = {
+            "min_support": 2,
+            "max_itemset_size": 2,
+            "sequence": {"turns": 3, "min_support": 2},
+            "counter": {
+                "targets": ["aggro_rush"],
+                "min_lift": 1.0,
+            },
+            "top_n_decks": 5,
+        }
         with tempfile.TemporaryDirectory() as tmpdir:
-            config = EvolutionConfig(
-                global_seed=42,
-                generations=2,
-                population_size=6,
-                matches_per_eval=1,
-                elite_pool_size=3,
-                elitism=2,
-                tournament_k=3,
-                cards_path=CARDS_JSON,
-                seed_decks=[
-                    os.path.join(DATA_DIR, "decks", "aggro_rush.json"),
-                    os.path.join(DATA_DIR, "decks", "control_mage.json"),
-                    os.path.join(DATA_DIR, "decks", "midrange.json"),
-                ],
-                initial_population="seed_decks",
-                output_dir=tmpdir,
-                log_every_n=1,
-                top_n_summary=3,
-                telemetry={
-                    "enabled": True,
-                    "save_match_summaries": True,
-                    "save_turn_trace": False,
-                },
-            )
-            runner = EvolutionRunner(config)
-            runner.run()
-
-            pat_config = {
-                "min_support": 2,
-                "max_itemset_size": 2,
-                "sequence": {"turns": 3, "min_support": 2},
-                "counter": {
-                    "targets": ["aggro_rush"],
-                    "min_lift": 1.0,
-                },
-                "top_n_decks": 5,
-            }
             output_path = os.path.join(tmpdir, "patterns.json")
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
                 patterns = extract_all_patterns(
-                    tmpdir, pat_config, output_path=output_path,
+                    artifact_dir, pat_config, output_path=output_path,
                 )
                 # Should have warned about missing turn_trace
                 trace_warnings = [
@@ -525,24 +489,29 @@ class TestTurnTraceOff(unittest.TestCase):
 class TestTurnTraceCollection(unittest.TestCase):
     """Verify that turn_trace is properly collected by telemetry."""
 
-    def test_turn_trace_present_in_summary(self):
+    @classmethod
+    def setUpClass(cls):
         from card_battle.ai import GreedyAI
-        from card_battle.engine import init_game, run_game
         from card_battle.loader import load_cards, load_deck
-        from card_battle.telemetry import MatchTelemetry
 
-        card_db = load_cards(CARDS_JSON)
-        deck_a = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), card_db,
+        # GreedyAI is stateless; one instance plays both seats in every test
+        greedy = GreedyAI()
+        cls.agents = (greedy, greedy)
+        cls.card_db = load_cards(CARDS_JSON)
+        cls.deck_a = load_deck(
+            _DECK_PATHS["aggro_rush"], cls.card_db,
         )
-        deck_b = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), card_db,
+        cls.deck_b = load_deck(
+            _DECK_PATHS["control_mage"], cls.card_db,
         )
 
+    def test_turn_trace_present_in_summary(self):
+        from card_battle.engine import init_game, run_game
+        from card_battle.telemetry import MatchTelemetry
+
         tm = MatchTelemetry(save_turn_trace=True, turn_trace_max_cards=3)
-        gs = init_game(card_db, deck_a, deck_b, 42)
-        agents = (GreedyAI(), GreedyAI())
-        run_game(gs, agents, telemetry=tm)
+        gs = init_game(self.card_db, self.deck_a, self.deck_b, 42)
+        run_game(gs, self.agents, telemetry=tm)
 
         summary = tm.to_summary()
         self.assertIn("turn_trace", summary)
@@ -559,46 +528,24 @@ class TestTurnTraceCollection(unittest.TestCase):
             self.assertIsInstance(entry["played"], list)
 
     def test_turn_trace_absent_when_off(self):
-        from card_battle.ai import GreedyAI
         from card_battle.engine import init_game, run_game
-        from card_battle.loader import load_cards, load_deck
         from card_battle.telemetry import MatchTelemetry
 
-        card_db = load_cards(CARDS_JSON)
-        deck_a = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), card_db,
-        )
-        deck_b = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), card_db,
-        )
-
         tm = MatchTelemetry(save_turn_trace=False)
-        gs = init_game(card_db, deck_a, deck_b, 42)
-        agents = (GreedyAI(), GreedyAI())
-        run_game(gs, agents, telemetry=tm)
+        gs = init_game(self.card_db, self.deck_a, self.deck_b, 42)
+        run_game(gs, self.agents, telemetry=tm)
 
         summary = tm.to_summary()
         self.assertNotIn("turn_trace", summary)
 
     def test_max_cards_truncation(self):
-        from card_battle.ai import GreedyAI
         from card_battle.engine import init_game, run_game
-        from card_battle.loader import load_cards, load_deck
         from card_battle.telemetry import MatchTelemetry
 
-        card_db = load_cards(CARDS_JSON)
-        deck_a = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), card_db,
-        )
-        deck_b = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), card_db,
-        )
-
         # Use max_cards=1 to test truncation
         tm = MatchTelemetry(save_turn_trace=True, turn_trace_max_cards=1)
-        gs = init_game(card_db, deck_a, deck_b, 42)
-        agents = (GreedyAI(), GreedyAI())
-        run_game(gs, agents, telemetry=tm)
+        gs = init_game(self.card_db, self.deck_a, self.deck_b, 42)
+        run_game(gs, self.agents, telemetry=tm)
 
         summary = tm.to_summary()
         for entry in summary["turn_trace"]:
@@ -1,12 +1,12 @@
 """Tests for v3.2: Multi-policy evaluation."""
 
+import itertools
 import os
 import tempfile
 import unittest
 
 from card_battle.ai import GreedyAI, RandomAI, SimpleAI
 from card_battle.evaluation import derive_match_seed, evaluate_deck_vs_pool
-from card_battle.loader import load_cards, load_deck
 from card_battle.policies import (
     Policy,
     PolicyRegistry,
@@ -14,6 +14,8 @@ from card_battle.policies import (
     normalize_weights,
 )
 
+from tests._fixtures import cached_card_db, cached_deck
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 
@@ -90,8 +92,8 @@ class TestNormalizeWeights(unittest.TestCase):
 
 
 class TestRandomAIDeterminism(unittest.TestCase):
-    def test_same_seed_same_result(self):
-        """Same seed produces identical action sequences over 5 replays."""
+    @classmethod
+    def setUpClass(cls):
         import random
         from card_battle.actions import EndTurn, PlayCard
         from card_battle.models import GameState, PlayerState, Card
@@ -100,53 +102,29 @@ class TestRandomAIDeterminism(unittest.TestCase):
             id="soldier", name="Soldier", cost=2, card_type="unit",
             tags=(), template="Vanilla", params={"atk": 2, "hp": 2},
         )}
-        actions = [PlayCard(hand_index=0), EndTurn()]
-
-        results = []
-        for _ in range(5):
-            ai = RandomAI(seed=123)
-            choices = [ai.choose_action(
-                GameState(
-                    turn=1, active_player=0,
-                    players=[PlayerState(mana=5, mana_max=5, deck=["soldier"] * 10),
-                             PlayerState(deck=["soldier"] * 10)],
-                    next_uid=1, result=None, rng=random.Random(42), card_db=card_db,
-                ),
-                actions,
-            ) for _ in range(3)]
-            results.append(choices)
+        cls.actions = [PlayCard(hand_index=0), EndTurn()]
+        # RandomAI never reads or writes the state, so one instance serves every choice
+        cls.state = GameState(
+            turn=1, active_player=0,
+            players=[PlayerState(mana=5, mana_max=5, deck=["soldier"] * 10),
+                     PlayerState(deck=["soldier"] * 10)],
+            next_uid=1, result=None, rng=random.Random(42), card_db=card_db,
+        )
+
+    def _choices(self, seed: int, n: int) -> list:
+        ai = RandomAI(seed=seed)
+        return [ai.choose_action(self.state, self.actions) for _ in range(n)]
+
+    def test_same_seed_same_result(self):
+        """Same seed produces identical action sequences over 5 replays."""
+        results = [self._choices(123, 3) for _ in range(5)]
 
         for r in results[1:]:
             self.assertEqual(results[0], r)
 
     def test_different_seeds_differ(self):
         """Different seeds produce different action sequences with high probability."""
-        import random
-        from card_battle.actions import EndTurn, PlayCard
-        from card_battle.models import GameState, PlayerState, Card
-
-        card_db = {"soldier": Card(
-            id="soldier", name="Soldier", cost=2, card_type="unit",
-            tags=(), template="Vanilla", params={"atk": 2, "hp": 2},
-        )}
-        actions = [PlayCard(hand_index=0), EndTurn()]
-
-        sequences = []
-        for seed in range(10):
-            ai = RandomAI(seed=seed)
-            choices = []
-            for _ in range(20):
-                c = ai.choose_action(
-                    GameState(
-                        turn=1, active_player=0,
-                        players=[PlayerState(mana=5, mana_max=5, deck=["soldier"] * 10),
-                                 PlayerState(deck=["soldier"] * 10)],
-                        next_uid=1, result=None, rng=random.Random(42), card_db=card_db,
-                    ),
-                    actions,
-                )
-                choices.append(c)
-            sequences.append(choices)
+        sequences = [self._choices(seed, 20) for seed in range(10)]
 
         # At least some seeds should produce different sequences
         unique = len(set(str(s) for s in sequences))
@@ -176,22 +154,28 @@ class TestDeriveMatchSeedWithPolicies(unittest.TestCase):
             ("simple", "simple"),
             ("random", "greedy"),
         ]
-        seeds = set()
-        for pc, po in pairs:
-            s = derive_match_seed(42, 0, "a", "b", 0, False, pc, po)
-            seeds.add(s)
+        seeds = {
+            derive_match_seed(42, 0, "a", "b", 0, False, pc, po)
+            for pc, po in pairs
+        }
         self.assertEqual(len(seeds), len(pairs))
 
+    def test_many_pairs_no_collision(self):
+        """256 ordered policy-name pairs all map to distinct seeds."""
+        names = [f"policy_{i}" for i in range(16)]
+        seeds = {
+            derive_match_seed(42, 0, "a", "b", 0, False, pc, po)
+            for pc, po in itertools.product(names, repeat=2)
+        }
+        self.assertEqual(len(seeds), len(names) ** 2)
+
 
 class TestMultiPolicyEvaluation(unittest.TestCase):
-    def setUp(self):
-        self.card_db = load_cards(CARDS_JSON)
-        self.aggro = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
-        )
-        self.control = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.aggro = cached_deck("aggro_rush")
+        cls.control = cached_deck("control_mage")
 
     def test_none_is_backward_compatible(self):
         """policy_mix=None produces the same result as v3.1."""
@@ -1,11 +1,13 @@
 """Tests for v0.7.1: Promotion pipeline."""
 
+import functools
 import json
 import os
+import shutil
 import tempfile
 import unittest
 
-from card_battle.loader import load_cards, load_deck
+from card_battle.loader import load_deck
 from card_battle.models import Card
 from card_battle.promotion import (
     IDConflictError,
@@ -20,6 +22,8 @@ from card_battle.promotion import (
     run_promotion,
 )
 
+from tests._fixtures import cached_card_db
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
 CONFIG_JSON = os.path.join(
@@ -59,9 +63,16 @@ def _sample_report(candidate=None) -> dict:
     }
 
 
-def _load_cards_list() -> list[dict]:
+@functools.lru_cache(maxsize=None)
+def _cards_json_text() -> str:
     with open(CARDS_JSON, encoding="utf-8") as f:
-        return json.load(f)
+        return f.read()
+
+
+def _load_cards_list() -> list[dict]:
+    # Fresh list per call (tests mutate it); decoding the cached text is
+    # cheaper than re-reading the file or deep-copying a parsed list
+    return json.loads(_cards_json_text())
 
 
 # -------------------------------------------------------------------------
@@ -271,13 +282,16 @@ class TestComputeGate(unittest.TestCase):
 # -------------------------------------------------------------------------
 
 class TestRunBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = cached_card_db(CARDS_JSON)
+        cls.targets = [load_deck(tp, cls.card_db) for tp in TARGET_PATHS]
+
     def test_smoke(self):
         """Benchmark runs to completion and returns correct structure."""
-        card_db = load_cards(CARDS_JSON)
-        targets = [load_deck(tp, card_db) for tp in TARGET_PATHS]
         benchmark_config = {"matches_per_pair": 1, "policies": None}
 
-        result = run_benchmark(card_db, targets, 42, benchmark_config)
+        result = run_benchmark(self.card_db, self.targets, 42, benchmark_config)
         self.assertIn("win_rates_by_target", result)
         self.assertIn("overall_win_rate", result)
         self.assertIn("telemetry_aggregate", result)
@@ -286,6 +300,66 @@ class TestRunBenchmark(unittest.TestCase):
         self.assertIsInstance(result["overall_win_rate"], float)
 
 
+# -------------------------------------------------------------------------
+# Shared promotion run
+# -------------------------------------------------------------------------
+
+# Minimal config for speed
+_PIPELINE_CONFIG = {
+    "seed": 42,
+    "max_promotions_per_run": 10,
+    "on_id_conflict": "fail",
+    "benchmark": {
+        "matches_per_pair": 1,
+        "policies": None,
+    },
+    "gate": {
+        "max_matchup_winrate": 0.95,
+        "turns_delta_ratio": 0.20,
+        "mana_wasted_delta_ratio": 0.20,
+    },
+}
+
+_SHARED_PROMOTION_TMPDIRS: list[str] = []
+
+
+def _run_pipeline(tmpdir: str) -> tuple[dict, str]:
+    """Write inputs into tmpdir and run the promotion; returns (result, output_dir)."""
+    selected_path = os.path.join(tmpdir, "selected_cards.json")
+    pool_path = os.path.join(tmpdir, "cards.json")
+    config_path = os.path.join(tmpdir, "config.json")
+    output_dir = os.path.join(tmpdir, "output")
+
+    with open(selected_path, "w") as f:
+        json.dump([_sample_report()], f)
+    with open(pool_path, "w") as f:
+        json.dump(_load_cards_list(), f)
+    with open(config_path, "w") as f:
+        json.dump(_PIPELINE_CONFIG, f)
+
+    result = run_promotion(
+        selected_path=selected_path,
+        pool_path=pool_path,
+        target_paths=TARGET_PATHS,
+        config_path=config_path,
+        output_dir=output_dir,
+    )
+    return result, output_dir
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_promotion_run() -> tuple[dict, str]:
+    """Run the pipeline once per module; returns (result, output_dir)."""
+    tmpdir = tempfile.mkdtemp()
+    _SHARED_PROMOTION_TMPDIRS.append(tmpdir)
+    return _run_pipeline(tmpdir)
+
+
+def tearDownModule():
+    for tmpdir in _SHARED_PROMOTION_TMPDIRS:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
 # -------------------------------------------------------------------------
 # TestEndToEndSmoke
 # -------------------------------------------------------------------------
@@ -293,70 +367,31 @@ class TestRunBenchmark(unittest.TestCase):
 class TestEndToEndSmoke(unittest.TestCase):
     def test_full_pipeline(self):
         """Full promotion pipeline completes and generates all artifacts."""
-        cards_list = _load_cards_list()
-        reports = [_sample_report()]
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write inputs
-            selected_path = os.path.join(tmpdir, "selected_cards.json")
-            pool_path = os.path.join(tmpdir, "cards.json")
-            config_path = os.path.join(tmpdir, "config.json")
-            output_dir = os.path.join(tmpdir, "output")
-
-            with open(selected_path, "w") as f:
-                json.dump(reports, f)
-            with open(pool_path, "w") as f:
-                json.dump(cards_list, f)
-
-            # Use minimal config for speed
-            config = {
-                "seed": 42,
-                "max_promotions_per_run": 10,
-                "on_id_conflict": "fail",
-                "benchmark": {
-                    "matches_per_pair": 1,
-                    "policies": None,
-                },
-                "gate": {
-                    "max_matchup_winrate": 0.95,
-                    "turns_delta_ratio": 0.20,
-                    "mana_wasted_delta_ratio": 0.20,
-                },
-            }
-            with open(config_path, "w") as f:
-                json.dump(config, f)
-
-            result = run_promotion(
-                selected_path=selected_path,
-                pool_path=pool_path,
-                target_paths=TARGET_PATHS,
-                config_path=config_path,
-                output_dir=output_dir,
-            )
-
-            # Check return value
-            self.assertIn("gate_passed", result)
-            self.assertIn("exit_reason", result)
-            self.assertIn("cards_added", result)
-            self.assertIn("report_path", result)
-            self.assertEqual(result["cards_added"], 1)
-
-            # Check all 5 artifacts exist
-            expected_files = [
-                "cards_before.json",
-                "cards_after.json",
-                "promotion_patch.json",
-                "promotion_report.json",
-                "run_meta.json",
-            ]
-            for fname in expected_files:
-                fpath = os.path.join(output_dir, fname)
-                self.assertTrue(os.path.exists(fpath), f"Missing: {fname}")
-
-            # Verify cards_after has 21 cards
-            with open(os.path.join(output_dir, "cards_after.json")) as f:
-                after = json.load(f)
-            self.assertEqual(len(after), 21)
+        result, output_dir = _shared_promotion_run()
+
+        # Check return value
+        self.assertIn("gate_passed", result)
+        self.assertIn("exit_reason", result)
+        self.assertIn("cards_added", result)
+        self.assertIn("report_path", result)
+        self.assertEqual(result["cards_added"], 1)
+
+        # Check all 5 artifacts exist
+        expected_files = [
+            "cards_before.json",
+            "cards_after.json",
+            "promotion_patch.json",
+            "promotion_report.json",
+            "run_meta.json",
+        ]
+        for fname in expected_files:
+            fpath = os.path.join(output_dir, fname)
+            self.assertTrue(os.path.exists(fpath), f"Missing: {fname}")
+
+        # Verify cards_after has 21 cards
+        with open(os.path.join(output_dir, "cards_after.json")) as f:
+            after = json.load(f)
+        self.assertEqual(len(after), 21)
 
 
 # -------------------------------------------------------------------------
@@ -366,49 +401,15 @@ class TestEndToEndSmoke(unittest.TestCase):
 class TestDeterminism(unittest.TestCase):
     def test_same_seed_same_result(self):
         """Same config + seed produces identical promotion_report.json."""
-        cards_list = _load_cards_list()
-        reports = [_sample_report()]
-
         results = []
-        for _ in range(2):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                selected_path = os.path.join(tmpdir, "selected_cards.json")
-                pool_path = os.path.join(tmpdir, "cards.json")
-                config_path = os.path.join(tmpdir, "config.json")
-                output_dir = os.path.join(tmpdir, "output")
-
-                with open(selected_path, "w") as f:
-                    json.dump(reports, f)
-                with open(pool_path, "w") as f:
-                    json.dump(cards_list, f)
-
-                config = {
-                    "seed": 42,
-                    "max_promotions_per_run": 10,
-                    "on_id_conflict": "fail",
-                    "benchmark": {
-                        "matches_per_pair": 1,
-                        "policies": None,
-                    },
-                    "gate": {
-                        "max_matchup_winrate": 0.95,
-                        "turns_delta_ratio": 0.20,
-                        "mana_wasted_delta_ratio": 0.20,
-                    },
-                }
-                with open(config_path, "w") as f:
-                    json.dump(config, f)
-
-                run_promotion(
-                    selected_path=selected_path,
-                    pool_path=pool_path,
-                    target_paths=TARGET_PATHS,
-                    config_path=config_path,
-                    output_dir=output_dir,
-                )
-
-                with open(os.path.join(output_dir, "promotion_report.json")) as f:
-                    results.append(json.load(f))
+        _, shared_output = _shared_promotion_run()
+        with open(os.path.join(shared_output, "promotion_report.json")) as f:
+            results.append(json.load(f))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _, output_dir = _run_pipeline(tmpdir)
+            with open(os.path.join(output_dir, "promotion_report.json")) as f:
+                results.append(json.load(f))
 
         self.assertEqual(results[0], results[1])
 
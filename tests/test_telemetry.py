@@ -10,6 +10,12 @@ from card_battle.telemetry import MatchTelemetry, TelemetryConfig
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 CARDS_JSON = os.path.join(DATA_DIR, "cards.json")
+_DECK_NAMES = ("aggro_rush", "control_mage", "midrange")
+_DECK_PATHS = {n: os.path.join(DATA_DIR, "decks", f"{n}.json") for n in _DECK_NAMES}
+
+# GreedyAI keeps no per-game state, so one instance can play both seats
+_GREEDY = GreedyAI()
+_AGENTS = (_GREEDY, _GREEDY)
 
 
 class TestTelemetryConfig(unittest.TestCase):
@@ -24,20 +30,19 @@ class TestMatchTelemetry(unittest.TestCase):
     def setUp(self):
         self.card_db = load_cards(CARDS_JSON)
         self.aggro = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
+            _DECK_PATHS["aggro_rush"], self.card_db
         )
         self.control = load_deck(
-            os.path.join(DATA_DIR, "decks", "control_mage.json"), self.card_db
+            _DECK_PATHS["control_mage"], self.card_db
         )
         self.midrange = load_deck(
-            os.path.join(DATA_DIR, "decks", "midrange.json"), self.card_db
+            _DECK_PATHS["midrange"], self.card_db
         )
 
     def _run_with_telemetry(self, deck_a, deck_b, seed=42):
         gs = init_game(self.card_db, deck_a, deck_b, seed)
-        agents = (GreedyAI(), GreedyAI())
         tm = MatchTelemetry()
-        log = run_game(gs, agents, telemetry=tm)
+        log = run_game(gs, _AGENTS, telemetry=tm)
         return log, tm
 
     def test_summary_has_expected_keys(self):
@@ -104,13 +109,11 @@ class TestDeterminismRegression(unittest.TestCase):
     def setUp(self):
         self.card_db = load_cards(CARDS_JSON)
         self.decks = [
-            load_deck(os.path.join(DATA_DIR, "decks", f), self.card_db)
-            for f in ["aggro_rush.json", "control_mage.json", "midrange.json"]
+            load_deck(_DECK_PATHS[n], self.card_db) for n in _DECK_NAMES
         ]
 
     def test_telemetry_does_not_affect_outcome(self):
         """Same seed → same winner regardless of telemetry on/off."""
-        agents = (GreedyAI(), GreedyAI())
         for seed in range(20):
             for da in self.decks:
                 for db in self.decks:
@@ -118,12 +121,12 @@ class TestDeterminismRegression(unittest.TestCase):
                         continue
                     # Without telemetry
                     gs1 = init_game(self.card_db, da, db, seed)
-                    log1 = run_game(gs1, agents)
+                    log1 = run_game(gs1, _AGENTS)
 
                     # With telemetry
                     gs2 = init_game(self.card_db, da, db, seed)
                     tm = MatchTelemetry()
-                    log2 = run_game(gs2, agents, telemetry=tm)
+                    log2 = run_game(gs2, _AGENTS, telemetry=tm)
 
                     self.assertEqual(
                         log1.winner, log2.winner,
@@ -139,18 +142,17 @@ class TestMultipleSeedsTelemetry(unittest.TestCase):
     def setUp(self):
         self.card_db = load_cards(CARDS_JSON)
         self.aggro = load_deck(
-            os.path.join(DATA_DIR, "decks", "aggro_rush.json"), self.card_db
+            _DECK_PATHS["aggro_rush"], self.card_db
         )
         self.midrange = load_deck(
-            os.path.join(DATA_DIR, "decks", "midrange.json"), self.card_db
+            _DECK_PATHS["midrange"], self.card_db
         )
 
     def test_50_games_no_crash(self):
-        agents = (GreedyAI(), GreedyAI())
         for seed in range(50):
             gs = init_game(self.card_db, self.aggro, self.midrange, seed)
             tm = MatchTelemetry()
-            log = run_game(gs, agents, telemetry=tm)
+            log = run_game(gs, _AGENTS, telemetry=tm)
             summary = tm.to_summary()
             self.assertIn("winner", summary)
             # Mana invariant